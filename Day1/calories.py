@@ -1,25 +1,30 @@
 """Advent of Code 2022 - Day 1 Solution"""
-INPUT_FILE = "Day1/input.txt"
-
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappushpop, nlargest
+from itertools import chain
+from pathlib import Path
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+try:
+    import numpy as np
+except ImportError:  # vectorized path is optional
+    np = None
 
-    Args:
-        input_file (str): file name
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import map_input, read_lines
 
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day1/input.txt"
+TOP_ELVES = 3
+CHUNK_SIZE = 16 * 1024 * 1024  # worker peaks at about 7 x chunk size
 
 
-def pack_elves(items: list) -> dict:
+def pack_elves(items: Iterable[str]) -> dict:
     """Calculate calories carried by each elf
 
     Args:
-        items_list (list): list of items (calories)
+        items (Iterable[str]): lines of items (calories), may be lazy
 
     Returns:
         dict: number of an elf with calories carried
@@ -70,8 +75,216 @@ def get_three_most_caories(elves: dict) -> int:
     return most_three
 
 
+def top_calories(items: Iterable[str], k: int = TOP_ELVES) -> list:
+    """Streams items once keeping only k biggest calories sums in a min-heap,
+    memory does not depend on number of elves. Like pack_elves, an elf is counted
+    when blank line closes its items
+
+    Args:
+        items (Iterable[str]): lines of items (calories), may be lazy
+        k (int, optional): number of elves to keep. Defaults to TOP_ELVES.
+
+    Returns:
+        list: up to k biggest calories sums, descending
+    """
+    if k <= 0:
+        return []
+    heap = []
+    calories = 0
+    for item in items:
+        if item:
+            calories += int(item)
+            continue
+        if len(heap) < k:
+            heappush(heap, calories)
+        elif calories > heap[0]:
+            heappushpop(heap, calories)
+        calories = 0
+    return sorted(heap, reverse=True)
+
+
+def group_sums_numpy(buffer: bytes, final: bool = True) -> "np.ndarray":
+    """Vectorized pack_elves: parses whole input buffer (bytes or mmap) at once.
+    Line values are built digit column by digit column, elf sums are differences
+    of cumulative sum taken at blank lines. Whitespace after the last item is
+    ignored, same as load_input/read_lines do. Line offsets are int32 (for buffers
+    under 2 GiB) and temporaries are freed early, peak memory including the buffer
+    is about 7 x buffer size
+
+    Args:
+        buffer (bytes): raw input file contents
+        final (bool, optional): buffer ends the input, when False (buffer is a chunk
+            of bigger input) trailing blank lines still close groups. Defaults to True.
+
+    Returns:
+        np.ndarray: calories carried by each elf, in order
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if final:  # trailing whitespace is dropped, as split_on_groups does
+        data = data[: _content_end(buffer)]
+    offset_type = np.int32 if data.size < 2 ** 31 else np.int64
+    ends = np.flatnonzero(data == ord('\n')).astype(offset_type)
+    if data.size and data[-1] != ord('\n'):
+        ends = np.append(ends, offset_type(data.size))
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends
+    lengths -= starts
+    del ends
+    lengths -= data[np.maximum(starts + lengths - 1, 0)] == ord('\r')  # blank lines end at '\n'
+
+    longest = int(lengths.max(initial=0))
+    values = np.zeros(lengths.size, dtype=np.int32 if longest < 10 else np.int64)
+    for column in range(longest):
+        rows = lengths > column
+        digits = data[starts[rows] + column]
+        digits -= ord('0')
+        values[rows] = values[rows] * 10 + digits
+
+    closing = np.flatnonzero(lengths == 0)
+    totals = np.cumsum(values, dtype=np.int64)[closing]
+    return np.diff(totals, prepend=0)
+
+
+def top_calories_numpy(buffer: bytes, k: int = TOP_ELVES) -> list:
+    """Vectorized top_calories, k biggest sums are selected with argpartition
+
+    Args:
+        buffer (bytes): raw input file contents
+        k (int, optional): number of elves to keep. Defaults to TOP_ELVES.
+
+    Returns:
+        list: up to k biggest calories sums, descending
+    """
+    return _largest_numpy(group_sums_numpy(buffer), k)
+
+
+def _largest_numpy(sums: "np.ndarray", k: int) -> list:
+    """Up to k biggest sums, descending, selected with argpartition"""
+    if k <= 0:
+        return []
+    if sums.size > k:
+        sums = sums[np.argpartition(sums, -k)[-k:]]
+    return sorted(sums.tolist(), reverse=True)
+
+
+def _content_end(buffer: bytes) -> int:
+    """Offset just after last non-whitespace byte, found walking back from the end"""
+    content_end = len(buffer)
+    while content_end and buffer[content_end-1: content_end].isspace():
+        content_end -= 1
+    return content_end
+
+
+def _next_group_start(buffer: bytes, position: int) -> int:
+    """Finds offset of first line following a blank line, searching from the line
+    containing given position
+
+    Args:
+        buffer (bytes): raw input file contents
+        position (int): offset to search from
+
+    Returns:
+        int: offset of group start, len(buffer) when there is none
+    """
+    line_start = buffer.rfind(b'\n', 0, position) + 1
+    while True:
+        line_end = buffer.find(b'\n', line_start)
+        if line_end < 0:
+            return len(buffer)
+        if not buffer[line_start: line_end].strip():
+            return line_end + 1
+        line_start = line_end + 1
+
+
+def split_on_groups(buffer: bytes, chunk_size: int = CHUNK_SIZE) -> list:
+    """Splits input into chunks of about chunk_size bytes, every split is moved
+    forward to start of the next group so no elf spans two chunks.
+    Trailing whitespace is left out, so the last chunk behaves like rstrip()-ed input
+
+    Args:
+        buffer (bytes): raw input file contents
+        chunk_size (int, optional): target chunk size in bytes. Defaults to CHUNK_SIZE.
+
+    Returns:
+        list: (start, end) byte offsets of chunks
+    """
+    content_end = _content_end(buffer)
+    offsets = [0]
+    position = chunk_size
+    while position < content_end:
+        boundary = _next_group_start(buffer, position)
+        if boundary >= content_end:
+            break
+        offsets.append(boundary)
+        position = boundary + chunk_size
+    offsets.append(content_end)
+    return list(zip(offsets, offsets[1:]))
+
+
+def chunk_top_calories(file_path: str, start: int, end: int, k: int = TOP_ELVES) -> list:
+    """Local top k of a single chunk, run in worker process.
+    Chunk produced by split_on_groups ends either with blank line closing
+    its last elf or at the end of input
+
+    Args:
+        file_path (str): input file name
+        start (int): chunk start offset
+        end (int): chunk end offset
+        k (int, optional): number of elves to keep. Defaults to TOP_ELVES.
+
+    Returns:
+        list: up to k biggest calories sums of chunk, descending
+    """
+    with open(file_path, mode='rb') as file:
+        file.seek(start)
+        chunk = file.read(end - start)
+    if np is not None:
+        return _largest_numpy(group_sums_numpy(chunk, final=False), k)
+    return top_calories(chunk.decode("UTF-8").splitlines(), k)
+
+
+def top_calories_parallel(file_path: str, k: int = TOP_ELVES, workers: int = None,
+                          chunk_size: int = CHUNK_SIZE) -> list:
+    """Multi-core top_calories for multi-GB inputs: file is split on group
+    boundaries, chunks are reduced in a process pool and local top k lists merged.
+    Each worker holds one chunk at a time and peaks at about 7 x chunk_size,
+    roughly 110 MiB with default CHUNK_SIZE
+
+    Args:
+        file_path (str): input file name
+        k (int, optional): number of elves to keep. Defaults to TOP_ELVES.
+        workers (int, optional): worker processes. Defaults to number of cores.
+        chunk_size (int, optional): target chunk size in bytes. Defaults to CHUNK_SIZE.
+
+    Returns:
+        list: up to k biggest calories sums, descending
+    """
+    with map_input(file_path) as buffer:
+        chunks = split_on_groups(buffer, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        partials = pool.map(chunk_top_calories, *zip(*((file_path, start, end, k)
+                                                       for start, end in chunks)))
+        return nlargest(k, chain.from_iterable(partials))
+
+
+def parse(lines: Iterable[str]) -> list:
+    """Parses input lines into calories of elves carrying the most, single pass for both parts"""
+    return top_calories(lines, TOP_ELVES)
+
+
+def part1(top: list) -> int:
+    """Part 1 answer for parsed input"""
+    return top[0]
+
+
+def part2(top: list) -> int:
+    """Part 2 answer for parsed input"""
+    return sum(top[:3])
+
+
 if __name__ == "__main__":
-    items_list = load_input(INPUT_FILE)
-    elves_packed = pack_elves(items_list)
-    print(f"Part 1 answer: {get_most_calories(elves_packed)}")
-    print(f"Part 2 answer: {get_three_most_caories(elves_packed)}")
+    top_elves = parse(read_lines(INPUT_FILE))
+    print(f"Part 1 answer: {part1(top_elves)}")
+    print(f"Part 2 answer: {part2(top_elves)}")
@@ -1,18 +1,13 @@
 """Advent of Code 2022 - Day 10 Solution"""
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
 
-INPUT_FILE = "Day10/input.txt"
-
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-    Args:
-        input_file (str): file name
-
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day10/input.txt"
 
 def calculate_signal_strenght(input_commands: list) -> int:
     """Calculates signal strenghts in given cycles
@@ -86,8 +81,22 @@ def render_image(input_commands:list):
                 draw_pixel(cycle-1, sprite)
                 check_row(cycle)
 
+def parse(lines: list) -> list:
+    """Parses input lines into list of commands"""
+    return lines
+
+def part1(input_commands: list) -> int:
+    """Part 1 answer for parsed input"""
+    return calculate_signal_strenght(input_commands)
+
+def part2(input_commands: list) -> str:
+    """Part 2 answer for parsed input, rendered image is returned instead of printed"""
+    image = StringIO()
+    with redirect_stdout(image):
+        render_image(input_commands)
+    return image.getvalue()
+
 if __name__ == '__main__':
-    input_lines = load_input(INPUT_FILE)
-    print(f"Part 1 answer: {calculate_signal_strenght(input_lines)}")
-    print("Part 2 answer:")
-    render_image(input_lines)
+    input_lines = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(input_lines)}")
+    print(f"Part 2 answer:\n{part2(input_lines)}")
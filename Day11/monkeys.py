@@ -1,21 +1,15 @@
 """Advent of Code 2022 - Day 11 Solution"""
 import re
+import sys
+from copy import deepcopy
 from math import prod
+from pathlib import Path
 
-INPUT_FILE = "Day11/input.txt"
-
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-    Args:
-        input_file (str): file name
+INPUT_FILE = "Day11/input.txt"
 
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
-    
 def init_monkey(monkey_lines: list) -> dict:
     """Initializes dict of monkey attributes
 
@@ -85,13 +79,24 @@ def calc_score(monkeys: dict) -> int:
     inspected = sorted([monkey['inspected'] for monkey in monkeys.values()], reverse=True)
     return inspected[0] * inspected[1]
 
+def parse(lines: list) -> tuple:
+    """Parses input lines into dict of monkeys and worry modulo"""
+    return find_monkeys(lines)
+
+def part1(monkeys_and_modulo: tuple) -> int:
+    """Part 1 answer for parsed input, parsed monkeys are left untouched"""
+    monkeys, worry_modulo = monkeys_and_modulo
+    monkeys = play_keep_away(deepcopy(monkeys), worry_modulo, rounds=20, lower_worry=3)
+    return calc_score(monkeys)
+
+def part2(monkeys_and_modulo: tuple) -> int:
+    """Part 2 answer for parsed input, parsed monkeys are left untouched"""
+    monkeys, worry_modulo = monkeys_and_modulo
+    monkeys = play_keep_away(deepcopy(monkeys), worry_modulo, rounds=10000, lower_worry=1)
+    return calc_score(monkeys)
+
 if __name__ == '__main__':
-    lines_of_input = load_input(INPUT_FILE)
-    monkeys_list1, modulo = find_monkeys(lines_of_input)
-    monkeys_part1 = play_keep_away(monkeys_list1, modulo, rounds=20, lower_worry=3)
-    print(f"Part 1 answer: {calc_score(monkeys_part1)}")
-
-    monkeys_list2, modulo = find_monkeys(lines_of_input)
-    monkeys_part2 = play_keep_away(monkeys_list2, modulo, rounds=10000, lower_worry=1)
-    print(f"Part 2 answer: {calc_score(monkeys_part2)}")
+    monkeys_input = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(monkeys_input)}")
+    print(f"Part 2 answer: {part2(monkeys_input)}")
     
\ No newline at end of file
@@ -1,19 +1,12 @@
 """Advent of Code 2022 - Day 12 Solution"""
+import sys
 from collections import deque
+from pathlib import Path
 
-INPUT_FILE = "Day12/input.txt"
-
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-    Args:
-        input_file (str): file name
-
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day12/input.txt"
 
 def climb(grid: list, *start_points: str) -> int:
     """Calculates shorthest path to climb from any of start_points to 'E'
@@ -56,7 +49,19 @@ def climb(grid: list, *start_points: str) -> int:
         walk(x, y + 1, length, point)
         walk(x, y - 1, length, point)
 
+def parse(lines: list) -> list:
+    """Parses input lines into hills map"""
+    return lines
+
+def part1(grid: list) -> int:
+    """Part 1 answer for parsed input"""
+    return climb(grid, 'S')
+
+def part2(grid: list) -> int:
+    """Part 2 answer for parsed input"""
+    return climb(grid, 'S', 'a')
+
 if __name__ == '__main__':
-    input_lines = load_input(INPUT_FILE)
-    print(f"Part 1 answer: {climb(input_lines, 'S')}")
-    print(f"Part 2 answer: {climb(input_lines, 'S', 'a')}")
+    input_lines = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(input_lines)}")
+    print(f"Part 2 answer: {part2(input_lines)}")
@@ -1,18 +1,14 @@
 """Advent of Code 2022 - Day 2 Solution"""
-INPUT_FILE = "Day2/input.txt"
-
+import sys
+from collections import Counter
+from collections.abc import Iterable
+from itertools import permutations
+from pathlib import Path
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
-
-    Args:
-        input_file (str): file name
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import read_chunks
 
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day2/input.txt"
 
 
 def play_rps(strategy: list) -> int:
@@ -119,7 +115,126 @@ def predict_strategy(strategy: list) -> list:
     return predicted_strategy
 
 
+LINE_KINDS = tuple(f"{oponents_play} {your_play}" for oponents_play in 'ABC' for your_play in 'XYZ')
+# score of every possible line for both parts, precomputed with the functions above
+PART1_SCORES = {kind: play_rps([kind]) for kind in LINE_KINDS}
+PART2_SCORES = {kind: play_rps(predict_strategy([kind])) for kind in LINE_KINDS}
+
+
+def count_line_kinds(chunks: Iterable[bytes]) -> dict:
+    """Counts each of 9 possible lines directly in raw input bytes, chunks are cut
+    after their last newline so no line is split, no line strings or lists are created
+
+    Args:
+        chunks (Iterable[bytes]): raw input file contents, e.g. read_chunks() or [bytes]
+
+    Returns:
+        dict: line kind with number of its occurrences
+    """
+    patterns = {kind: kind.encode() for kind in LINE_KINDS}
+    histogram = dict.fromkeys(LINE_KINDS, 0)
+    carry = b''
+    for chunk in chunks:
+        cut = chunk.rfind(b'\n') + 1
+        if not cut:  # no complete line in chunk yet
+            carry += chunk
+            continue
+        block = carry + chunk[: cut]
+        carry = chunk[cut:]
+        for kind, pattern in patterns.items():
+            histogram[kind] += block.count(pattern)
+    for kind, pattern in patterns.items():
+        histogram[kind] += carry.count(pattern)
+    return histogram
+
+
+def score_histogram(histogram: dict, scores: dict) -> int:
+    """Calculates total score of tournament from line kinds histogram
+
+    Args:
+        histogram (dict): line kind with number of its occurrences
+        scores (dict): line kind with its score, PART1_SCORES or PART2_SCORES
+
+    Returns:
+        int: total score
+    """
+    return sum(count * scores[kind] for kind, count in histogram.items())
+
+
+# meanings of X, Y, Z in both interpretations, in order of letters used by the functions above
+INTERPRETATIONS = {
+    'move': ('rock', 'paper', 'scissors'),  # part 1 - what you play
+    'outcome': ('lose', 'draw', 'win'),     # part 2 - how the round has to end
+}
+
+
+def all_mappings(interpretation: str = None) -> list:
+    """Lists every X, Y, Z mapping of given interpretation, or of both
+
+    Args:
+        interpretation (str, optional): 'move' or 'outcome'. Defaults to None (both).
+
+    Returns:
+        list: (interpretation, mapping) candidates, mapping like {'X': 'rock', ...}
+    """
+    interpretations = [interpretation] if interpretation else list(INTERPRETATIONS)
+    return [(name, dict(zip('XYZ', meanings)))
+            for name in interpretations for meanings in permutations(INTERPRETATIONS[name])]
+
+
+def mapping_scores(interpretation: str, mapping: dict) -> dict:
+    """Builds 9-entry score table of a single mapping
+
+    Args:
+        interpretation (str): 'move' or 'outcome'
+        mapping (dict): meaning of X, Y and Z
+
+    Returns:
+        dict: line kind with its score under given mapping
+    """
+    letters = dict(zip(INTERPRETATIONS[interpretation], 'XYZ'))
+    scores = PART1_SCORES if interpretation == 'move' else PART2_SCORES
+    return {kind: scores[f"{kind[0]} {letters[mapping[kind[2]]]}"] for kind in LINE_KINDS}
+
+
+def evaluate_mappings(histogram: dict, candidates: Iterable[tuple] = None) -> tuple:
+    """Scores many candidate mappings against the same tournament, log is read only
+    once to build histogram so each extra candidate costs just 9 multiplications
+
+    Args:
+        histogram (dict): line kinds histogram, see parse() or count_line_kinds()
+        candidates (Iterable[tuple], optional): (interpretation, mapping) pairs.
+            Defaults to all 12 mappings of both interpretations.
+
+    Returns:
+        tuple: results table (list of dicts, best first) and best result, None for no candidates
+    """
+    if candidates is None:
+        candidates = all_mappings()
+    table = [{'interpretation': interpretation, 'mapping': mapping,
+              'score': score_histogram(histogram, mapping_scores(interpretation, mapping))}
+             for interpretation, mapping in candidates]
+    table.sort(key=lambda result: result['score'], reverse=True)
+    return table, table[0] if table else None
+
+
+def parse(lines: list) -> dict:
+    """Parses input lines into line kinds histogram"""
+    counts = Counter(lines)
+    return {kind: counts[kind] for kind in LINE_KINDS}
+
+
+def part1(histogram: dict) -> int:
+    """Part 1 answer for parsed input"""
+    return score_histogram(histogram, PART1_SCORES)
+
+
+def part2(histogram: dict) -> int:
+    """Part 2 answer for parsed input"""
+    return score_histogram(histogram, PART2_SCORES)
+
+
 if __name__ == '__main__':
-    strategy_list = load_input(INPUT_FILE)
-    print(f"Part 1 answer: {play_rps(strategy_list)}")
-    print(f"Part 2 answer: {play_rps(predict_strategy(strategy_list))}")
+    line_kinds = count_line_kinds(read_chunks(INPUT_FILE))
+    print(f"Part 1 answer: {part1(line_kinds)}")
+    print(f"Part 2 answer: {part2(line_kinds)}")
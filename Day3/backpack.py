@@ -1,18 +1,25 @@
 """Advent of Code 2022 - Day 3 Solution"""
-INPUT_FILE = "Day3/input.txt"
-
+import string
+import sys
+from collections.abc import Iterator
+from functools import reduce
+from operator import and_, or_
+from pathlib import Path
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+try:
+    import numpy as np
+except ImportError:  # vectorized engine is optional
+    np = None
 
-    Args:
-        input_file (str): file name
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day3/input.txt"
+GROUP_SIZE = 3
+BLOCK_LINES = 3 * 8192  # backpacks parsed at once by vectorized engine
+# bit number of an item is its priority: a-z: 1-26, A-Z: 27-52
+ITEM_BITS = {item: 1 << priority
+             for priority, item in enumerate(string.ascii_lowercase + string.ascii_uppercase, start=1)}
 
 
 def find_same_item(backpack: str) -> str:
@@ -66,12 +73,205 @@ def identify_group(*group_backpacks: str) -> str:
     return badge
 
 
+def items_to_mask(items: str) -> int:
+    """Encodes set of items as 52-bit integer, bit number is item priority
+
+    Args:
+        items (str): items
+
+    Returns:
+        int: items mask
+    """
+    return reduce(or_, map(ITEM_BITS.__getitem__, items), 0)
+
+
+def mask_priority(mask: int) -> int:
+    """Calculates priority of an item encoded as single bit mask
+
+    Args:
+        mask (int): mask of one item
+
+    Returns:
+        int: priority (lowest one if mask has more items), 0 for empty mask
+    """
+    return max((mask & -mask).bit_length() - 1, 0)
+
+
+def backpack_to_masks(backpack: str) -> tuple:
+    """Encodes both compartments of backpack as masks
+
+    Args:
+        backpack (str): items in backpack
+
+    Returns:
+        tuple: masks of first and second compartment
+    """
+    half = len(backpack) // 2
+    return items_to_mask(backpack[: half]), items_to_mask(backpack[half:])
+
+
+def sum_misplaced(backpacks_masks: list) -> int:
+    """Sums priorities of items common to both compartments
+
+    Args:
+        backpacks_masks (list): compartments masks of backpacks
+
+    Returns:
+        int: sum of priorities
+    """
+    return sum(mask_priority(first & second) for first, second in backpacks_masks)
+
+
+def sum_badges(backpacks_masks: list, group_size: int = GROUP_SIZE) -> int:
+    """Sums priorities of badges, items common to all backpacks of each group
+
+    Args:
+        backpacks_masks (list): compartments masks of backpacks
+        group_size (int, optional): backpacks in group. Defaults to GROUP_SIZE.
+
+    Returns:
+        int: sum of priorities, incomplete last group is skipped
+    """
+    backpacks = [first | second for first, second in backpacks_masks]
+    return sum(mask_priority(reduce(and_, backpacks[idx: idx+group_size]))
+               for idx in range(0, len(backpacks) - group_size + 1, group_size))
+
+
+def _item_priorities() -> "np.ndarray":
+    """Lookup table from byte to item priority, 0 for bytes that are not items"""
+    priorities = np.zeros(256, dtype=np.uint8)
+    for item, bit in ITEM_BITS.items():
+        priorities[ord(item)] = bit.bit_length() - 1
+    return priorities
+
+
+def _line_starts(data: "np.ndarray", priorities: "np.ndarray") -> tuple:
+    """Drops bytes after the last item and finds offsets of lines, as int32
+
+    Returns:
+        tuple: trimmed data, offsets of line starts
+    """
+    content_end = data.size
+    while content_end and not priorities[data[content_end - 1]]:  # lines after last item are dropped
+        content_end -= 1
+    data = data[:content_end]
+    if not data.size:
+        return data, np.zeros(0, dtype=np.int32)
+    line_starts = np.flatnonzero(data == ord('\n')).astype(np.int32)
+    line_starts += 1
+    return data, np.concatenate((np.zeros(1, dtype=np.int32), line_starts))
+
+
+def _block_presence(block: "np.ndarray", starts: "np.ndarray", priorities: "np.ndarray") -> tuple:
+    """Presence matrices of a block of whole lines, starts are offsets of lines in block"""
+    item_priority = priorities[block]
+    is_item = item_priority > 0
+    row = np.repeat(np.arange(starts.size, dtype=np.int32), np.diff(starts, append=block.size))
+    items_upto = np.cumsum(is_item, dtype=np.int32)  # items up to and including each byte
+    line_end_items = np.append(items_upto[starts[1:] - 1], items_upto[-1])
+    line_start_items = line_end_items - np.diff(line_end_items, prepend=0)
+    rank = items_upto - line_start_items[row]  # 1-based position of item in its line
+    in_second = rank > (line_end_items - line_start_items)[row] // 2
+
+    first = np.zeros((starts.size, len(ITEM_BITS) + 1), dtype=bool)
+    second = np.zeros_like(first)
+    selected = is_item & ~in_second
+    first[row[selected], item_priority[selected]] = True
+    selected = is_item & in_second
+    second[row[selected], item_priority[selected]] = True
+    return first, second
+
+
+def presence_blocks(buffer: bytes, block_lines: int = BLOCK_LINES) -> Iterator[tuple]:
+    """Vectorized parsing of input buffer (bytes or mmap) into (backpacks x 53)
+    boolean matrices, one per compartment, column is item priority. Buffer is
+    processed in blocks of whole lines, so temporaries are bounded by block size
+    and per byte arrays are at most int32
+
+    Args:
+        buffer (bytes): raw input file contents
+        block_lines (int, optional): backpacks per block. Defaults to BLOCK_LINES.
+
+    Returns:
+        Iterator[tuple]: presence matrices of first and second compartments of every block
+    """
+    priorities = _item_priorities()
+    data, line_starts = _line_starts(np.frombuffer(buffer, dtype=np.uint8), priorities)
+    return _presence_blocks(data, line_starts, priorities, block_lines)
+
+
+def _presence_blocks(data: "np.ndarray", line_starts: "np.ndarray", priorities: "np.ndarray",
+                     block_lines: int) -> Iterator[tuple]:
+    """Splits trimmed data into blocks of whole lines for _block_presence()"""
+    for first_line in range(0, line_starts.size, block_lines):
+        block_start = line_starts[first_line]
+        next_line = first_line + block_lines
+        block_end = line_starts[next_line] if next_line < line_starts.size else data.size
+        yield _block_presence(data[block_start: block_end],
+                              line_starts[first_line: next_line] - block_start, priorities)
+
+
+def presence_matrices(buffer: bytes) -> tuple:
+    """Presence matrices of whole input, filled block by block, peak memory is
+    the matrices themselves plus one block of temporaries
+
+    Args:
+        buffer (bytes): raw input file contents
+
+    Returns:
+        tuple: presence matrices of first and second compartments
+    """
+    priorities = _item_priorities()
+    data, line_starts = _line_starts(np.frombuffer(buffer, dtype=np.uint8), priorities)
+    first = np.zeros((line_starts.size, len(ITEM_BITS) + 1), dtype=bool)
+    second = np.zeros_like(first)
+    row = 0
+    for block_first, block_second in _presence_blocks(data, line_starts, priorities, BLOCK_LINES):
+        first[row: row + block_first.shape[0]] = block_first
+        second[row: row + block_second.shape[0]] = block_second
+        row += block_first.shape[0]
+    return first, second
+
+
+def priorities_numpy(buffer: bytes, group_size: int = GROUP_SIZE) -> tuple:
+    """Vectorized engine answering both parts at once: intersections are batched
+    logical ANDs over presence matrices and common item is found with argmax.
+    Blocks hold whole groups, so full matrices are never kept in memory
+
+    Args:
+        buffer (bytes): raw input file contents
+        group_size (int, optional): backpacks in group. Defaults to GROUP_SIZE.
+
+    Returns:
+        tuple: sum of misplaced items priorities and sum of badges priorities
+    """
+    misplaced = 0
+    badges = 0
+    block_lines = max(BLOCK_LINES // group_size, 1) * group_size
+    for first, second in presence_blocks(buffer, block_lines):
+        misplaced += int(np.argmax(first & second, axis=1).sum())
+        groups = first.shape[0] // group_size
+        backpacks = (first | second)[: groups * group_size].reshape(groups, group_size, first.shape[1])
+        badges += int(np.argmax(backpacks.all(axis=1), axis=1).sum())
+    return misplaced, badges
+
+
+def parse(lines: list) -> list:
+    """Parses input lines into compartments masks of backpacks"""
+    return [backpack_to_masks(line) for line in lines]
+
+
+def part1(backpacks_masks: list) -> int:
+    """Part 1 answer for parsed input"""
+    return sum_misplaced(backpacks_masks)
+
+
+def part2(backpacks_masks: list) -> int:
+    """Part 2 answer for parsed input"""
+    return sum_badges(backpacks_masks, GROUP_SIZE)
+
+
 if __name__ == '__main__':
-    backpacks = load_input(INPUT_FILE)
-    misplaced_items = [find_same_item(backpack) for backpack in backpacks]
-    sum_of_priorities = sum(prioritize(item) for item in misplaced_items)
-    print(f"Part 1 answer: {sum_of_priorities}")
-    group_badges = [identify_group(backpacks[idx], backpacks[idx+1], backpacks[idx+2])
-                    for idx in range(0, len(backpacks)-1, 3)]
-    sum_of_group_priorities = sum(prioritize(badge) for badge in group_badges)
-    print(f"Part 2 answer: {sum_of_group_priorities}")
+    backpacks_list = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(backpacks_list)}")
+    print(f"Part 2 answer: {part2(backpacks_list)}")
@@ -1,18 +1,255 @@
 """Advent of Code 2022 - Day 4 Solution"""
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # vectorized path is optional
+    np = None
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
+
 INPUT_FILE = "Day4/input.txt"
 
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+class SectionRange():
+    """Range of sections assigned to an elf, stored just as its two ends
+    """
+    __slots__ = ('lower', 'upper')
+
+    def __init__(self, lower: int, upper: int):
+        self.lower = lower
+        self.upper = upper
+
+    def contains(self, other: 'SectionRange') -> bool:
+        return self.lower <= other.lower and other.upper <= self.upper
+
+    def overlaps(self, other: 'SectionRange') -> bool:
+        return self.lower <= other.upper and other.lower <= self.upper
+
+    def __len__(self):
+        return self.upper - self.lower + 1
+
+    def __repr__(self):
+        return f"{self.lower}-{self.upper}"
+
+
+def pairs_to_ranges(pairs_list: list) -> list:
+    """Converts list of pairs from input to section ranges,
+    memory does not depend on how many sections ranges cover
+
+    Args:
+        pairs_list (list): list of pairs from input
+
+    Returns:
+        list: list of pairs of SectionRange
+    """
+    pair_ranges = []
+    for pair in pairs_list:
+        first, second = pair.split(',')
+        first_lower, first_upper = first.split('-')
+        second_lower, second_upper = second.split('-')
+        pair_ranges.append((SectionRange(int(first_lower), int(first_upper)),
+                            SectionRange(int(second_lower), int(second_upper))))
+    return pair_ranges
+
+
+def count_pairs(pairs_in_ranges: list) -> tuple:
+    """Counts contained and overlaping pairs in a single pass
+
+    Args:
+        pairs_in_ranges (list): list of pairs of SectionRange
+
+    Returns:
+        tuple: number of contained pairs, number of overlaping pairs
+    """
+    contained = 0
+    overlaping = 0
+    for first, second in pairs_in_ranges:
+        if first.overlaps(second):
+            overlaping += 1
+            if first.contains(second) or second.contains(first):
+                contained += 1
+    return contained, overlaping
+
+
+class _IntervalNode():
+    """Node of centered interval tree, keeps ranges covering its center
+    """
+    __slots__ = ('center', 'by_lower', 'by_upper', 'left', 'right')
+
+    def __init__(self, center: int, covering: list):
+        self.center = center
+        self.by_lower = sorted(covering, key=lambda item: item[1].lower)
+        self.by_upper = sorted(covering, key=lambda item: item[1].upper, reverse=True)
+        self.left = None
+        self.right = None
+
+
+class SectionIndex():
+    """Index over section ranges of the whole roster, answers cross-assignment
+    questions without comparing every pair of ranges
+    """
+
+    def __init__(self, ranges: list):
+        """
+        Args:
+            ranges (list): SectionRange objects, their positions are used as ids
+        """
+        self.ranges = ranges
+        self._lowers = sorted(section.lower for section in ranges)
+        self._uppers = sorted(section.upper for section in ranges)
+        self._root = self._build(list(enumerate(ranges)))
+
+    @classmethod
+    def from_pairs(cls, pairs_in_ranges: list) -> 'SectionIndex':
+        """Builds index of all ranges, pair i gives ids 2*i and 2*i + 1
+
+        Args:
+            pairs_in_ranges (list): list of pairs of SectionRange
+
+        Returns:
+            SectionIndex: index
+        """
+        return cls([section for pair in pairs_in_ranges for section in pair])
+
+    @staticmethod
+    def _build(items: list) -> _IntervalNode:
+        """Builds interval tree, center of every node is median of its ranges ends
+        so tree depth is O(log n)"""
+        if not items:
+            return None
+        ends = sorted(end for _, section in items for end in (section.lower, section.upper))
+        center = ends[len(ends) // 2]
+        node = _IntervalNode(center, [item for item in items
+                                      if item[1].lower <= center <= item[1].upper])
+        node.left = SectionIndex._build([item for item in items if item[1].upper < center])
+        node.right = SectionIndex._build([item for item in items if item[1].lower > center])
+        return node
+
+    def overlapping(self, query: SectionRange) -> list:
+        """Finds all ranges overlapping given one in O(log n + k)
+
+        Args:
+            query (SectionRange): range to check
+
+        Returns:
+            list: sorted ids of overlapping ranges
+        """
+        found = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node is None:
+                continue
+            if query.upper < node.center:
+                for item in node.by_lower:
+                    if item[1].lower > query.upper:
+                        break
+                    found.append(item[0])
+                nodes.append(node.left)
+            elif query.lower > node.center:
+                for item in node.by_upper:
+                    if item[1].upper < query.lower:
+                        break
+                    found.append(item[0])
+                nodes.append(node.right)
+            else:
+                found.extend(item[0] for item in node.by_lower)
+                nodes.append(node.left)
+                nodes.append(node.right)
+        return sorted(found)
+
+    def depth_at(self, section: int) -> int:
+        """Counts ranges covering given section in O(log n)
+
+        Args:
+            section (int): section id
+
+        Returns:
+            int: number of elves assigned to section
+        """
+        return bisect_right(self._lowers, section) - bisect_left(self._uppers, section)
+
+    def coverage(self) -> list:
+        """Sweeps over ranges ends to find how many elves cover each section
+
+        Returns:
+            list: (first section, last section, depth) segments in order, depth > 0
+        """
+        events = sorted([(section.lower, 1) for section in self.ranges] +
+                        [(section.upper + 1, -1) for section in self.ranges])
+        segments = []
+        depth = 0
+        for idx, (position, change) in enumerate(events):
+            depth += change
+            if idx + 1 < len(events) and events[idx + 1][0] == position:
+                continue  # apply all changes at the same position first
+            if depth and idx + 1 < len(events):
+                segments.append((position, events[idx + 1][0] - 1, depth))
+        return segments
+
+    def max_depth(self) -> int:
+        """Finds highest number of elves covering a single section
+
+        Returns:
+            int: maximum coverage depth
+        """
+        return max((depth for _, _, depth in self.coverage()), default=0)
+
+    def count_overlapping_pairs(self) -> int:
+        """Counts pairs of ranges from the whole roster that overlap, in O(n log n).
+        Pairs that do not overlap have one range ending before other starts
+
+        Returns:
+            int: number of overlapping pairs
+        """
+        total = len(self.ranges)
+        disjoint = sum(bisect_left(self._uppers, lower) for lower in self._lowers)
+        return total * (total - 1) // 2 - disjoint
+
+
+def pairs_array_numpy(buffer: bytes) -> "np.ndarray":
+    """Vectorized parsing of whole input buffer (bytes or mmap) into (n, 4) array
+    of ranges ends. Digit runs are found from edges of digit mask, numbers are
+    built digit column by digit column
 
     Args:
-        input_file (str): file name
+        buffer (bytes): raw input file contents
 
     Returns:
-        list: list of file contents line by line
+        np.ndarray: rows of first lower, first upper, second lower, second upper
     """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    is_digit = np.zeros(data.size + 2, dtype=np.int8)
+    is_digit[1: -1] = (data >= ord('0')) & (data <= ord('9'))
+    edges = np.flatnonzero(np.diff(is_digit))
+    starts, ends = edges[0::2], edges[1::2]
+    lengths = ends - starts
+
+    numbers = np.zeros(starts.size, dtype=np.int64)
+    for column in range(int(lengths.max(initial=0))):
+        has_digit = lengths > column
+        numbers[has_digit] = numbers[has_digit] * 10 + (data[starts[has_digit] + column] - ord('0'))
+    return numbers.reshape(-1, 4)
+
+
+def count_pairs_numpy(pairs: "np.ndarray") -> tuple:
+    """Vectorized count_pairs over (n, 4) array of ranges ends
+
+    Args:
+        pairs (np.ndarray): output of pairs_array_numpy()
+
+    Returns:
+        tuple: number of contained pairs, number of overlaping pairs
+    """
+    first_lower, first_upper, second_lower, second_upper = pairs.T
+    contained = ((first_lower <= second_lower) & (second_upper <= first_upper)) | \
+        ((second_lower <= first_lower) & (first_upper <= second_upper))
+    overlaping = (first_lower <= second_upper) & (second_lower <= first_upper)
+    return int(np.count_nonzero(contained)), int(np.count_nonzero(overlaping))
 
 
 def pairs_to_sets(pairs_list: list) -> list:
@@ -67,7 +304,22 @@ def find_overlaping(pairs_in_sets: list) -> int:
     return overlaping
 
 
+def parse(lines: list) -> list:
+    """Parses input lines into pairs of section ranges"""
+    return pairs_to_ranges(lines)
+
+
+def part1(pairs_in_ranges: list) -> int:
+    """Part 1 answer for parsed input"""
+    return count_pairs(pairs_in_ranges)[0]
+
+
+def part2(pairs_in_ranges: list) -> int:
+    """Part 2 answer for parsed input"""
+    return count_pairs(pairs_in_ranges)[1]
+
+
 if __name__ == '__main__':
-    list_of_pairs = load_input(INPUT_FILE)
-    print(f"Part 1 answer: {find_contained(pairs_to_sets(list_of_pairs))}")
-    print(f"Part 2 answer: {find_overlaping(pairs_to_sets(list_of_pairs))}")
+    contained_pairs, overlaping_pairs = count_pairs(parse(load_input(INPUT_FILE)))
+    print(f"Part 1 answer: {contained_pairs}")
+    print(f"Part 2 answer: {overlaping_pairs}")
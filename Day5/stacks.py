@@ -1,20 +1,12 @@
 """Advent of Code 2022 - Day 5 Solution"""
 import re
+import sys
+from pathlib import Path
 
-INPUT_FILE = "Day5/input.txt"
-
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
-
-    Args:
-        input_file (str): file name
-
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day5/input.txt"
 
 
 class Stack():
@@ -43,6 +35,9 @@ class Stack():
     def size(self):
         return len(self._stack)
 
+    def to_list(self):
+        return list(self._stack)
+
     def __str__(self):
         toString = ""
         for element in self._stack:
@@ -104,27 +99,35 @@ def process_input(input_list: list) -> tuple:
     return (stacks_list, moves_list)
 
 
-def use_crane_9000():
-    """Uses crane 9000 to move crates in scenerio with stack_1,
+def use_crane_9000(stacks: list, moves: list):
+    """Uses crane 9000 to move crates in given stacks,
     one crate is moved at once
+
+    Args:
+        stacks (list): stacks to move crates between, modified in place
+        moves (list): moves to perform
     """
     for move in moves:
         for _ in range(int(move[0])):
-            crate = stacks_1[int(move[1])-1].pop()
-            stacks_1[int(move[2])-1].push(crate)
+            crate = stacks[int(move[1])-1].pop()
+            stacks[int(move[2])-1].push(crate)
 
 
-def use_crane_9001():
-    """Uses crane 9001 with leather seats to move crates in scenerio with stack_2,
+def use_crane_9001(stacks: list, moves: list):
+    """Uses crane 9001 with leather seats to move crates in given stacks,
     multiple crates can be moved at once
+
+    Args:
+        stacks (list): stacks to move crates between, modified in place
+        moves (list): moves to perform
     """
     for move in moves:
         crates = []
         for _ in range(int(move[0])):
-            crates.append(stacks_2[int(move[1])-1].pop())
+            crates.append(stacks[int(move[1])-1].pop())
         crates = crates[:: -1]
         for crate in crates:
-            stacks_2[int(move[2])-1].push(crate)
+            stacks[int(move[2])-1].push(crate)
 
 
 def peek_all(stacks_to_peek: list) -> str:
@@ -143,11 +146,183 @@ def peek_all(stacks_to_peek: list) -> str:
     return peek_str
 
 
+def parse_moves(moves_list: list) -> list:
+    """Converts moves to ints once, stacks numbers become 0-based indexes
+
+    Args:
+        moves_list (list): moves from init_moves()
+
+    Returns:
+        list: (count, source, target) tuples
+    """
+    return [(int(count), int(source) - 1, int(target) - 1) for count, source, target in moves_list]
+
+
+def move_crates_9000(stacks: list, count: int, source: int, target: int):
+    """Crane 9000 moves crates one at a time, so moved slice lands reversed"""
+    crates = stacks[source]
+    stacks[target].extend(reversed(crates[len(crates) - count:]))
+    del crates[len(crates) - count:]
+
+
+def move_crates_9001(stacks: list, count: int, source: int, target: int):
+    """Crane 9001 moves all crates at once, so moved slice keeps its order"""
+    crates = stacks[source]
+    stacks[target].extend(crates[len(crates) - count:])
+    del crates[len(crates) - count:]
+
+
+CRANE_MODELS = {
+    9000: move_crates_9000,
+    9001: move_crates_9001,
+}
+
+
+def run_crane(stacks: list, moves: list, model: int) -> list:
+    """Runs all moves with given crane model. Works only on its arguments,
+    so many simulations can run side by side, e.g. in threads
+
+    Args:
+        stacks (list): lists of crates, bottom first, left untouched
+        moves (list): (count, source, target) tuples from parse_moves()
+        model (int): crane model, key of CRANE_MODELS
+
+    Returns:
+        list: lists of crates after all moves
+    """
+    move_crates = CRANE_MODELS[model]
+    stacks = [list(stack) for stack in stacks]
+    for count, source, target in moves:
+        move_crates(stacks, count, source, target)
+    return stacks
+
+
+def top_crates(stacks: list) -> str:
+    """Peek all top crates from given lists of crates, empty stacks are skipped
+
+    Args:
+        stacks (list): lists of crates
+
+    Returns:
+        str: peeked crates in order
+    """
+    return ''.join(stack[-1] for stack in stacks if stack)
+
+
+def trace_top_crates(stacks: list, moves: list, model: int) -> str:
+    """Finds top crates after all moves without simulating stacks. Every final top
+    position (stack, depth from top) is traced back through moves in reverse order
+    to its place in initial stacks, O(moves * stacks) time, O(stacks) extra memory
+
+    Args:
+        stacks (list): lists of crates before first move, bottom first
+        moves (list): (count, source, target) tuples from parse_moves()
+        model (int): crane model, key of CRANE_MODELS
+
+    Returns:
+        str: peeked crates in order, same as top_crates(run_crane(...))
+    """
+    if model not in CRANE_MODELS:
+        raise KeyError(model)
+    heights = [len(stack) for stack in stacks]
+    for count, source, target in moves:
+        heights[source] -= count
+        heights[target] += count
+
+    positions = [[idx, 0] for idx, height in enumerate(heights) if height]
+    for count, source, target in reversed(moves):
+        if source == target:  # cranes leave the stack as it was
+            continue
+        for position in positions:
+            stack, depth = position
+            if stack == target:
+                if depth < count:  # crate was moved by this move
+                    position[0] = source
+                    position[1] = count - 1 - depth if model == 9000 else depth
+                else:
+                    position[1] = depth - count
+            elif stack == source:
+                position[1] = depth + count
+    return ''.join(stacks[stack][-1 - depth] for stack, depth in positions)
+
+
+class CraneReplay():
+    """Answers queries about stacks after any number of moves. Snapshots of
+    stacks are stored every `interval` moves (as tuples, so they are never
+    modified), a query restores nearest earlier snapshot and replays at most
+    interval - 1 moves. Smaller interval means faster queries and more memory
+    """
+
+    def __init__(self, stacks: list, moves: list, model: int, interval: int = 1000):
+        """
+        Args:
+            stacks (list): lists of crates before first move
+            moves (list): (count, source, target) tuples from parse_moves()
+            model (int): crane model, key of CRANE_MODELS
+            interval (int, optional): moves between snapshots. Defaults to 1000.
+        """
+        if interval < 1:
+            raise ValueError("interval has to be positive")
+        self.moves = moves
+        self.move_crates = CRANE_MODELS[model]
+        self.interval = interval
+        self._snapshots = [tuple(tuple(stack) for stack in stacks)]  # i-th after i*interval moves
+
+    def _replay(self, snapshot: tuple, start: int, stop: int) -> list:
+        stacks = [list(stack) for stack in snapshot]
+        for count, source, target in self.moves[start: stop]:
+            self.move_crates(stacks, count, source, target)
+        return stacks
+
+    def stacks_at(self, step: int) -> list:
+        """Stacks after given number of moves, snapshots up to that step are created on demand
+
+        Args:
+            step (int): number of performed moves, 0 to len(moves)
+
+        Returns:
+            list: lists of crates, bottom first
+        """
+        if not 0 <= step <= len(self.moves):
+            raise IndexError(f"step has to be between 0 and {len(self.moves)}")
+        checkpoint = step // self.interval
+        while len(self._snapshots) <= checkpoint:
+            start = (len(self._snapshots) - 1) * self.interval
+            stacks = self._replay(self._snapshots[-1], start, start + self.interval)
+            self._snapshots.append(tuple(tuple(stack) for stack in stacks))
+        return self._replay(self._snapshots[checkpoint], checkpoint * self.interval, step)
+
+    def tops_at(self, step: int) -> str:
+        """Top crates after given number of moves
+
+        Args:
+            step (int): number of performed moves, 0 to len(moves)
+
+        Returns:
+            str: peeked crates in order
+        """
+        return top_crates(self.stacks_at(step))
+
+
+def parse(lines: list) -> tuple:
+    """Parses input lines into lists of crates and int moves"""
+    stacks, moves = process_input(lines)
+    return [stack.to_list() for stack in stacks], parse_moves(moves)
+
+
+def part1(stacks_and_moves: tuple) -> str:
+    """Part 1 answer for parsed input"""
+    stacks, moves = stacks_and_moves
+    return top_crates(run_crane(stacks, moves, 9000))
+
+
+def part2(stacks_and_moves: tuple) -> str:
+    """Part 2 answer for parsed input"""
+    stacks, moves = stacks_and_moves
+    return top_crates(run_crane(stacks, moves, 9001))
+
+
 if __name__ == '__main__':
-    input_file_list = load_input(INPUT_FILE)
-    stacks_1, moves = process_input(input_file_list)
-    stacks_2, moves = process_input(input_file_list)
-    use_crane_9000()
-    print(f"Part 1 answer: {peek_all(stacks_1)}")
-    use_crane_9001()
-    print(f"Part 2 answer: {peek_all(stacks_2)}")
+    crane_input = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(crane_input)}")
+    print(f"Part 2 answer: {part2(crane_input)}")
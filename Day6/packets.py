@@ -1,18 +1,19 @@
-"""Advent of Code 2022 - Day 5 Solution"""
-INPUT_FILE = "Day6/input.txt"
-
+"""Advent of Code 2022 - Day 6 Solution"""
+import sys
+from collections.abc import AsyncIterator, Iterable, Iterator
+from pathlib import Path
 
-def load_input(file_path: str) -> str:
-    """Loads input data from txt file
+try:
+    import numpy as np
+except ImportError:  # vectorized search is optional
+    np = None
 
-    Args:
-        input_file (str): file name
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import DEFAULT_CHUNK_SIZE, load_input, read_stream
 
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip()
+INPUT_FILE = "Day6/input.txt"
+PACKET_MARKER = 4
+MESSAGE_MARKER = 14
 
 
 def detect_start_packet_marker(datastream: str) -> int:
@@ -49,7 +50,217 @@ def detect_start_message_marker(datastream: str) -> int:
     return num_proc
 
 
+class MarkerDetector():
+    """Finds markers of many window sizes in a single pass over datastream.
+    Keeps index of last occurrence of every character and start of the longest
+    run of distinct characters ending at current position, so each character
+    is processed in O(1) no matter the window size
+    """
+
+    def __init__(self, window_sizes: tuple = (PACKET_MARKER, MESSAGE_MARKER)):
+        """
+        Args:
+            window_sizes (tuple, optional): numbers of distinct characters of markers.
+                Defaults to (PACKET_MARKER, MESSAGE_MARKER).
+        """
+        self.pending = sorted(set(window_sizes))
+        self.markers = dict.fromkeys(self.pending)
+        self.position = 0  # number of characters processed
+        self._run_start = 0
+        self._last_seen = {}
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    def feed(self, data) -> dict:
+        """Processes next part of datastream
+
+        Args:
+            data (str | bytes): next characters
+
+        Returns:
+            dict: window size with number of characters processed before its marker,
+                only for markers found in this part
+        """
+        found = {}
+        last_seen = self._last_seen
+        run_start = self._run_start
+        pending = self.pending
+        for offset, char in enumerate(data):
+            if not pending:
+                break
+            position = self.position + offset
+            previous = last_seen.get(char, -1)
+            if previous >= run_start:
+                run_start = previous + 1
+            last_seen[char] = position
+            while pending and position + 1 - run_start >= pending[0]:
+                found[pending.pop(0)] = position + 1
+        self.position += len(data)
+        self._run_start = run_start
+        self.markers.update(found)
+        return found
+
+
+def detect_markers(datastream, window_sizes: tuple = (PACKET_MARKER, MESSAGE_MARKER)) -> dict:
+    """Detects markers of all given window sizes in one O(n) pass
+
+    Args:
+        datastream (str | bytes): input datastream of characters
+        window_sizes (tuple, optional): numbers of distinct characters of markers.
+            Defaults to (PACKET_MARKER, MESSAGE_MARKER).
+
+    Returns:
+        dict: window size with number of characters processed before its marker was found,
+            None when there is no such marker
+    """
+    detector = MarkerDetector(window_sizes)
+    detector.feed(datastream)
+    return detector.markers
+
+
+def _strip_line_breaks(chunk: bytes) -> bytes:
+    """Line breaks are not part of datastream, e.g. trailing newline of a file"""
+    return chunk.translate(None, b'\r\n')
+
+
+def stream_markers(chunks: Iterable[bytes],
+                   window_sizes: tuple = (PACKET_MARKER, MESSAGE_MARKER)) -> Iterator[tuple]:
+    """Detects markers in datastream arriving in chunks (file, stdin, socket, ...).
+    Window state is carried over chunk boundaries, every marker is reported right
+    after chunk containing it is processed and reading stops once all are found
+
+    Args:
+        chunks (Iterable[bytes]): datastream chunks, e.g. read_chunks() or read_stream()
+        window_sizes (tuple, optional): numbers of distinct characters of markers.
+            Defaults to (PACKET_MARKER, MESSAGE_MARKER).
+
+    Yields:
+        tuple: window size and number of characters processed before its marker
+    """
+    detector = MarkerDetector(window_sizes)
+    for chunk in chunks:
+        yield from sorted(detector.feed(_strip_line_breaks(chunk)).items())
+        if detector.done:
+            return
+
+
+async def stream_markers_async(reader, window_sizes: tuple = (PACKET_MARKER, MESSAGE_MARKER),
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[tuple]:
+    """Asyncio version of stream_markers() reading from asyncio.StreamReader
+
+    Args:
+        reader (asyncio.StreamReader): source of datastream
+        window_sizes (tuple, optional): numbers of distinct characters of markers.
+            Defaults to (PACKET_MARKER, MESSAGE_MARKER).
+        chunk_size (int, optional): maximum bytes per read. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Yields:
+        tuple: window size and number of characters processed before its marker
+    """
+    detector = MarkerDetector(window_sizes)
+    while not detector.done and (chunk := await reader.read(chunk_size)):
+        for found in sorted(detector.feed(_strip_line_breaks(chunk)).items()):
+            yield found
+
+
+NUMPY_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def distinct_window_ends(data: "np.ndarray", window_size: int) -> "np.ndarray":
+    """Vectorized check of every window in uint8 array. For each position index of
+    previous occurrence of the same byte is found with stable argsort, window is
+    distinct when the biggest such index inside it lies before window start.
+    Sliding maximum is computed by doubling, O(n log w)
+
+    Args:
+        data (np.ndarray): uint8 array of datastream characters
+        window_size (int): number of distinct characters of marker
+
+    Returns:
+        np.ndarray: bool array, True at last index of every distinct window
+    """
+    size = data.size
+    ends = np.zeros(size, dtype=bool)
+    if size < window_size:
+        return ends
+    order = np.argsort(data, kind='stable')
+    previous_sorted = np.full(size, -1, dtype=np.int64)
+    same = data[order[1:]] == data[order[:-1]]
+    previous_sorted[1:][same] = order[:-1][same]
+    previous = np.empty(size, dtype=np.int64)
+    previous[order] = previous_sorted
+
+    window_max = previous.copy()  # max of previous over span ending at each index
+    span = 1
+    while span * 2 <= window_size:
+        np.maximum(window_max[span:], window_max[: size - span], out=window_max[span:])
+        span *= 2
+    rest = window_size - span
+    if rest:
+        window_max[rest:] = np.maximum(window_max[rest:], window_max[: size - rest])
+
+    starts = np.arange(size, dtype=np.int64) - window_size + 1
+    ends[window_size - 1:] = window_max[window_size - 1:] < starts[window_size - 1:]
+    return ends
+
+
+def find_markers_numpy(chunks: Iterable[bytes], window_size: int, every: bool = False):
+    """Vectorized marker search over datastream given in chunks (e.g. read_chunks()
+    with NUMPY_CHUNK_SIZE), so memory stays bounded. Line breaks are skipped and
+    last window_size - 1 characters of each chunk are carried into the next one
+
+    Args:
+        chunks (Iterable[bytes]): datastream chunks
+        window_size (int): number of distinct characters of marker
+        every (bool, optional): find all markers instead of the first one. Defaults to False.
+
+    Returns:
+        int | np.ndarray: number of characters processed before first marker (None when
+            there is none), or array of such numbers for every marker
+    """
+    found = []
+    carry = np.empty(0, dtype=np.uint8)
+    consumed = 0  # characters before start of carry
+    for chunk in chunks:
+        data = np.frombuffer(_strip_line_breaks(chunk), dtype=np.uint8)
+        data = np.concatenate((carry, data))
+        ends = np.flatnonzero(distinct_window_ends(data, window_size))
+        ends = ends[ends >= carry.size] + consumed + 1  # windows ending in carry were checked before
+        if ends.size and not every:
+            return int(ends[0])
+        found.append(ends)
+        keep = min(window_size - 1, data.size)
+        consumed += data.size - keep
+        carry = data[data.size - keep:].copy()
+    if not every:
+        return None
+    return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+
+def parse(lines: list) -> str:
+    """Parses input lines into single datastream"""
+    return ''.join(lines)
+
+
+def part1(datastream: str) -> int:
+    """Part 1 answer for parsed input"""
+    return detect_markers(datastream, (PACKET_MARKER,))[PACKET_MARKER]
+
+
+def part2(datastream: str) -> int:
+    """Part 2 answer for parsed input"""
+    return detect_markers(datastream, (MESSAGE_MARKER,))[MESSAGE_MARKER]
+
+
 if __name__ == '__main__':
-    input_stream = load_input(INPUT_FILE)
-    print(f"Part 1 answer: {detect_start_packet_marker(input_stream)}")
-    print(f"Part 2 answer: {detect_start_message_marker(input_stream)}")
+    if len(sys.argv) > 1:  # stream given file, or stdin for '-', reporting markers as they are found
+        with (open(sys.argv[1], mode='rb') if sys.argv[1] != '-' else sys.stdin.buffer) as source:
+            for window_size, processed in stream_markers(read_stream(source)):
+                print(f"Marker of {window_size} distinct characters after {processed} characters",
+                      flush=True)
+    else:
+        markers = detect_markers(parse(load_input(INPUT_FILE)))
+        print(f"Part 1 answer: {markers[PACKET_MARKER]}")
+        print(f"Part 2 answer: {markers[MESSAGE_MARKER]}")
@@ -1,170 +1,280 @@
 """Advent of Code 2022 - Day 7 Solution"""
-import re
-from math import inf
-
-INPUT_FILE = "Day7/input.txt"
-current_path = '/'
-dir_tree = {}
-result1 = 0
-result2 = inf
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input, read_lines
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+INPUT_FILE = "Day7/input.txt"
+SMALL_DIR_LIMIT = 100000
+DISK_SPACE = 70000000
+UPDATE_SPACE = 30000000
 
-    Args:
-        input_file (str): file name
 
-    Returns:
-        list: list of file contents line by line
+class Directory():
+    """Directory node, size covers its files and all subdirectories
     """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+    __slots__ = ('name', 'children', 'files', 'size')
 
+    def __init__(self, name: str):
+        self.name = name
+        self.children = {}
+        self.files = {}
+        self.size = 0
 
-def go_to_outermost():
-    """Changes current_path to outermost directory
-    """
-    global current_path
-    current_path = '/'
+    def subdir(self, name: str) -> 'Directory':
+        """Returns subdirectory of given name, creates it when it is not known yet
 
+        Args:
+            name (str): directory name
 
-def go_out():
-    """Changes current_path to one directory up
-    """
-    global current_path
-    idx = current_path.rfind('/')
-    current_path = current_path[: idx]
+        Returns:
+            Directory: subdirectory
+        """
+        child = self.children.get(name)
+        if child is None:
+            child = self.children[name] = Directory(name)
+        return child
+
+    def __repr__(self):
+        return f"{self.name} (dir, size={self.size})"
 
 
-def go_in(direct: str):
-    """Changes current_path to given directory down
+def add_file(directory: Directory, name: str, size: int):
+    """Adds file to directory, listing the same file again does not count it twice
 
     Args:
-        direct (str): directory to change to
+        directory (Directory): current directory
+        name (str): file name
+        size (int): file size
     """
-    global current_path
-    if current_path == '/':
-        current_path += direct
-    else:
-        current_path += '/' + direct
+    directory.size += size - directory.files.get(name, 0)
+    directory.files[name] = size
 
 
-def execute_command(command: str):
-    """Executes given command
+def build_dir_tree(terminal_output: list) -> Directory:
+    """Builds directory tree from terminal output in linear time. Current directory
+    is tracked with stack of directories leading to it, size of a directory is
+    added to its parent when it is left, so directories on the stack hold just
+    what was listed inside them so far
 
     Args:
-        command (str): line of command
-    """
-    if re.match('cd', command):
-        direct = command[3:]
-        match direct:
-            case '/':
-                go_to_outermost()
-            case '..':
-                go_out()
-            case _:
-                go_in(direct)
-
+        terminal_output (list): list of commands lines from output
 
-def create_new(name: str, size: int=None):
-    """Creates new file or directory in current_path
+    Returns:
+        Directory: outermost directory
+    """
+    root = Directory('/')
+    path = [root]
+    for line in terminal_output:
+        if line.startswith('$ cd '):
+            direct = line[5:]
+            match direct:
+                case '/':
+                    while len(path) > 1:
+                        _leave_dir(path)
+                case '..':
+                    if len(path) > 1:
+                        _leave_dir(path)
+                case _:
+                    parent = path[-1]
+                    child = parent.subdir(direct)
+                    parent.size -= child.size  # added back when directory is left again
+                    path.append(child)
+        elif line.startswith('dir '):
+            path[-1].subdir(line[4:])
+        elif line and line[0] != '$':
+            size, name = line.split(' ', 1)
+            add_file(path[-1], name, int(size))
+    while len(path) > 1:
+        _leave_dir(path)
+    return root
+
+
+def _leave_dir(path: list):
+    """Pops current directory and adds its size to its parent"""
+    directory = path.pop()
+    path[-1].size += directory.size
+
+
+def iter_directories(root: Directory) -> Iterator[Directory]:
+    """Iterates over directory and all its subdirectories without recursion
 
     Args:
-        name (str): name of file/dir to create
-        size (int, optional): size of new file. Defaults to None when dir is being created.
+        root (Directory): outermost directory
+
+    Yields:
+        Directory: every directory of the tree
     """
-    global dir_tree
-    subdirs = current_path.split('/')[1:]
-    if not subdirs[0] and not size:
-        dir_tree[name] = {}
-    elif not subdirs[0] and size:
-        dir_tree[name] = size
-    else:
-        dest_dir = 'dir_tree'
-        for subdir in subdirs:
-            dest_dir += f"['{subdir}']"
-        if size:
-            exec(dest_dir + f"['{name}'] = {size}")
-        else:
-            exec(dest_dir + f"['{name}']" + ' = {}')
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        yield directory
+        stack.extend(directory.children.values())
 
 
-def process_output(line: str):
-    """Process terminal output that was not a command
+def stream_dir_sizes(terminal_output: Iterable[str]) -> Iterator[int]:
+    """Yields size of every directory once it is left, without building the tree.
+    Only running sizes of directories on current path are kept, so memory depends
+    on tree depth. Every directory is expected to be listed once, as in puzzle input
 
     Args:
-        line (str): terminal output line
-    """
-    if re.match('dir', line):
-        name = line[4:]
-        create_new(name)
-    else:
-        size, name = line.split(' ')
-        create_new(name, size)
-
+        terminal_output (Iterable[str]): lines of terminal output, e.g. read_lines()
 
-def build_dir_tree(terminal_output: list):
-    """Builds directory tree from terminal output
+    Yields:
+        int: size of finished directory, outermost one comes last
+    """
+    path_sizes = [0]
+    for line in terminal_output:
+        if line.startswith('$ cd '):
+            direct = line[5:]
+            match direct:
+                case '/':
+                    while len(path_sizes) > 1:
+                        yield _leave(path_sizes)
+                case '..':
+                    if len(path_sizes) > 1:
+                        yield _leave(path_sizes)
+                case _:
+                    path_sizes.append(0)
+        elif line and line[0].isdigit():
+            path_sizes[-1] += int(line.split(' ', 1)[0])
+    while len(path_sizes) > 1:
+        yield _leave(path_sizes)
+    yield path_sizes[0]
+
+
+def _leave(path_sizes: list) -> int:
+    """Pops size of current directory and adds it to its parent"""
+    size = path_sizes.pop()
+    path_sizes[-1] += size
+    return size
+
+
+def stream_answers(file_path: str, limit: int = SMALL_DIR_LIMIT, disk_space: int = DISK_SPACE,
+                   space_required: int = UPDATE_SPACE) -> tuple:
+    """Answers both parts reading terminal output lazily twice, first pass sums small
+    directories and finds used space, second one finds directory to delete
 
     Args:
-        terminal_output (list): list of commands lines from output
+        file_path (str): input file
+        limit (int, optional): biggest size of small directory. Defaults to SMALL_DIR_LIMIT.
+        disk_space (int, optional): total disk space. Defaults to DISK_SPACE.
+        space_required (int, optional): free space needed by update. Defaults to UPDATE_SPACE.
+
+    Returns:
+        tuple: sum of sizes of small directories, size of directory to delete
     """
-    for line in terminal_output:
-        if line[0] == '$':
-            execute_command(line[2:])
-        else:
-            process_output(line)
+    small_space = 0
+    total = 0
+    for size in stream_dir_sizes(read_lines(file_path)):
+        if size <= limit:
+            small_space += size
+        total = size
+    space_needed = space_required - (disk_space - total)
+    del_space = min((size for size in stream_dir_sizes(read_lines(file_path)) if size >= space_needed),
+                    default=None)
+    return small_space, del_space
+
+
+class DirectorySizes():
+    """Sorted sizes of all directories with prefix sums, answers size queries
+    with bisect without walking the tree again
+    """
+
+    def __init__(self, sizes: Iterable[int], total: int):
+        """
+        Args:
+            sizes (Iterable[int]): size of every directory, outermost one included
+            total (int): size of outermost directory, i.e. used disk space
+        """
+        self.sizes = sorted(sizes)
+        self.prefix = [0, *accumulate(self.sizes)]
+        self.total = total
+
+    @classmethod
+    def from_tree(cls, root: Directory) -> 'DirectorySizes':
+        """Collects sizes of all directories of the tree in one pass
+
+        Args:
+            root (Directory): outermost directory
+
+        Returns:
+            DirectorySizes: size index
+        """
+        return cls((directory.size for directory in iter_directories(root)), root.size)
+
+    def sum_at_most(self, threshold: int) -> int:
+        """Sum of sizes of directories not bigger than threshold"""
+        return self.prefix[bisect_right(self.sizes, threshold)]
+
+    def smallest_at_least(self, size: int) -> int:
+        """Size of smallest directory at least as big as given size, None when there is none"""
+        idx = bisect_left(self.sizes, size)
+        return self.sizes[idx] if idx < len(self.sizes) else None
+
+    def largest(self, k: int) -> list:
+        """Sizes of k largest directories, biggest first"""
+        if k <= 0:
+            return []
+        return self.sizes[max(len(self.sizes) - k, 0):][::-1]
 
+    def __len__(self):
+        return len(self.sizes)
 
-def find_small_space(node: dict=dir_tree) -> int:
-    """Recursion over all directories and its files.
-    Finds all directories of size <= 100000 and calculates sum of their sizes as result1
+
+def find_small_space(sizes: DirectorySizes, limit: int = SMALL_DIR_LIMIT) -> int:
+    """Sums sizes of all directories of size <= limit
 
     Args:
-        node (dict, optional): current directory being searched. Defaults to dir_tree as outermost one.
+        sizes (DirectorySizes): directory size index
+        limit (int, optional): biggest size of small directory. Defaults to SMALL_DIR_LIMIT.
 
     Returns:
-        int: size of current directory
+        int: sum of sizes of small directories
     """
-    global result1
-    temp_res = 0
-    for value in node.values():
-        if isinstance(value, dict):
-            temp_res += find_small_space(value)
-        else:
-            temp_res += int(value)
-    if temp_res <= 100000:
-        result1 += temp_res
-    return temp_res
-
-
-def find_del_space(node: dict=dir_tree) -> int:
-    """Recursion over all directories and its files.
-    Finds smallest direcory that has at least space_needed size and sets it as result2
+    return sizes.sum_at_most(limit)
+
+
+def find_del_space(sizes: DirectorySizes, disk_space: int = DISK_SPACE,
+                   space_required: int = UPDATE_SPACE) -> int:
+    """Finds smallest directory which deletion frees enough space for the update
 
     Args:
-        node (dict, optional): current directory being searched. Defaults to dir_tree as outermost one.
+        sizes (DirectorySizes): directory size index
+        disk_space (int, optional): total disk space. Defaults to DISK_SPACE.
+        space_required (int, optional): free space needed by update. Defaults to UPDATE_SPACE.
 
     Returns:
-        int: size of current directory
+        int: size of directory to delete, None when even deleting everything is not enough
     """
-    global result2
-    temp_res = 0
-    for value in node.values():
-        if isinstance(value, dict):
-            temp_res += find_del_space(value)
-        else:
-            temp_res += int(value)
-    if temp_res >= space_needed and temp_res < result2:
-        result2 = temp_res
-    return temp_res
+    space_needed = space_required - (disk_space - sizes.total)
+    return sizes.smallest_at_least(space_needed)
+
+
+def parse(lines: list) -> DirectorySizes:
+    """Parses input lines into index of directory sizes"""
+    return DirectorySizes.from_tree(build_dir_tree(lines))
+
+
+def part1(sizes: DirectorySizes) -> int:
+    """Part 1 answer for parsed input"""
+    return find_small_space(sizes)
+
+
+def part2(sizes: DirectorySizes) -> int:
+    """Part 2 answer for parsed input"""
+    return find_del_space(sizes)
+
 
 if __name__ == '__main__':
-    input_lines = load_input(INPUT_FILE)
-    build_dir_tree(input_lines)
-    full_disk_space = find_small_space()
-    space_needed = 30000000 - (70000000 - full_disk_space)
-    find_del_space()
-    print(f"Part 1 answer: {result1}")
-    print(f"Part 2 answer: {result2}")
+    if len(sys.argv) > 1:  # stream given file, memory bounded by tree depth
+        answers = stream_answers(sys.argv[1])
+    else:
+        dir_sizes = parse(load_input(INPUT_FILE))
+        answers = part1(dir_sizes), part2(dir_sizes)
+    print(f"Part 1 answer: {answers[0]}")
+    print(f"Part 2 answer: {answers[1]}")
@@ -1,19 +1,13 @@
 """Advent of Code 2022 - Day 8 Solution"""
-import numpy as np
-
-INPUT_FILE = "Day8/input.txt"
+import sys
+from pathlib import Path
 
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+import numpy as np
 
-    Args:
-        input_file (str): file name
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day8/input.txt"
 
 def input_to_matrix(lines: list) -> np.ndarray:
     """Converts lines of input to forrest grid (matrix)
@@ -110,9 +104,20 @@ def find_max_scenic_score(grid: np.ndarray) -> int:
                 max_score = curr_score
     return max_score
 
+def parse(lines: list) -> np.ndarray:
+    """Parses input lines into forrest grid"""
+    return input_to_matrix(lines)
+
+def part1(grid: np.ndarray) -> int:
+    """Part 1 answer for parsed input"""
+    return count_visible(grid)
+
+def part2(grid: np.ndarray) -> int:
+    """Part 2 answer for parsed input"""
+    return find_max_scenic_score(grid)
+
 if __name__ == '__main__':
-    input_lines = load_input(INPUT_FILE)
-    forrest = input_to_matrix(input_lines)
-    print(f"Part 1 answer: {count_visible(forrest)}")
-    print(f"Part 2 answer: {find_max_scenic_score(forrest)}")
+    forrest = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(forrest)}")
+    print(f"Part 2 answer: {part2(forrest)}")
     
\ No newline at end of file
@@ -1,19 +1,12 @@
 """Advent of Code 2022 - Day 9 Solution"""
+import sys
 from math import atan2, pi
+from pathlib import Path
 
-INPUT_FILE = "Day9/input.txt"
-
-def load_input(file_path: str) -> list:
-    """Loads input data from txt file
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.inputs import load_input
 
-    Args:
-        input_file (str): file name
-
-    Returns:
-        list: list of file contents line by line
-    """
-    with open(file_path, mode='r', encoding="UTF-8") as file:
-        return file.read().rstrip().split('\n')
+INPUT_FILE = "Day9/input.txt"
 
 def check_touching(first: tuple, second: tuple) -> bool:
     """Check if knots are touching each other
@@ -113,7 +106,19 @@ def count_visited(list_of_moves: list, n_knots: int) -> int:
             visited_list.add(knots[-1])
     return len(visited_list)
 
+def parse(lines: list) -> list:
+    """Parses input lines into list of head moves"""
+    return lines
+
+def part1(list_of_moves: list) -> int:
+    """Part 1 answer for parsed input"""
+    return count_visited(list_of_moves, 2)
+
+def part2(list_of_moves: list) -> int:
+    """Part 2 answer for parsed input"""
+    return count_visited(list_of_moves, 10)
+
 if __name__ == '__main__':
-    input_list = load_input(INPUT_FILE)
-    print(f"Part 1 answer: {count_visited(input_list, 2)}")
-    print(f"Part 2 answer: {count_visited(input_list, 10)}")
+    input_list = parse(load_input(INPUT_FILE))
+    print(f"Part 1 answer: {part1(input_list)}")
+    print(f"Part 2 answer: {part2(input_list)}")
@@ -0,0 +1,182 @@
+"""Advent of Code 2022 - scaling benchmark of day solvers
+
+Usage:
+    python benchmark.py [--days 1 9] [--repeat 3] [--seed 0] [--output bench_output.txt]
+
+For every day synthetic inputs of growing size are generated, then load,
+parse, part1 and part2 phases are timed separately. Results are written as
+JSON lines: one record per measurement ("kind": "timing") and one per day
+and phase with fitted exponent of time ~ size^k ("kind": "scaling").
+"""
+import argparse
+import json
+import math
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from pathlib import Path
+
+from common.days import PARTS, discover_days, load_day
+from common.generators import GENERATORS
+from common.inputs import load_input
+
+OUTPUT_FILE = "bench_output.txt"
+
+# sizes are chosen so that largest case of each day takes seconds, not minutes
+SIZES = {
+    1: (1000, 10000, 100000),
+    2: (1000, 10000, 100000),
+    3: (999, 9999, 99999),
+    4: (1000, 10000, 100000),
+    5: (500, 2000, 8000),
+    6: (1000, 10000, 100000),
+    7: (100, 1000, 10000),
+    8: (25, 50, 100),
+    9: (250, 1000, 4000),
+    10: (1000, 10000, 100000),
+    11: (50, 200, 800),
+    12: (20, 40, 80),
+}
+
+# Day 11 scales with number of rounds rather than input size
+DAY11_MONKEYS = 8
+
+
+def day11_input(rounds: int, seed: int) -> str:
+    """Day 11 input does not grow with rounds, same notes are used for every size"""
+    return GENERATORS[11](DAY11_MONKEYS, seed)
+
+
+def day11_parts(module, rounds: int) -> dict:
+    """Day 11 parts playing given number of rounds instead of fixed 20 / 10000"""
+    def play(data: tuple, lower_worry: int) -> int:
+        monkeys, worry_modulo = data
+        return module.calc_score(
+            module.play_keep_away(deepcopy(monkeys), worry_modulo, rounds, lower_worry))
+    return {1: lambda data: play(data, 3), 2: lambda data: play(data, 1)}
+
+
+def time_call(function, argument, repeat: int) -> tuple:
+    """Calls function repeatedly, returns best wall time and last result"""
+    best = math.inf
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_day(day: int, sizes: tuple, repeat: int, seed: int) -> list:
+    """Benchmarks all phases of given day over given sizes
+
+    Args:
+        day (int): day number
+        sizes (tuple): input sizes, meaning depends on the day
+        repeat (int): measurements per phase, best one is kept
+        seed (int): generators seed
+
+    Returns:
+        list: timing records
+    """
+    records = []
+    try:
+        module = load_day(day)
+    except Exception as error:  # e.g. missing optional dependency of that day
+        return [{'kind': 'error', 'day': day, 'error': f"{type(error).__name__}: {error}"}]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            if day == 11:
+                text, parts = day11_input(size, seed), day11_parts(module, size)
+            else:
+                text = GENERATORS[day](size, seed)
+                parts = {part: getattr(module, f"part{part}") for part in PARTS}
+            file_path = Path(tmp_dir) / f"day{day}_{size}.txt"
+            file_path.write_text(text, encoding="UTF-8")
+
+            record = {'kind': 'timing', 'day': day, 'size': size, 'bytes': len(text)}
+            try:
+                record['load'], lines = time_call(load_input, file_path, repeat)
+                record['parse'], data = time_call(module.parse, lines, repeat)
+                for part, solver in parts.items():
+                    record[f"part{part}"], _ = time_call(solver, data, repeat)
+            except Exception as error:
+                record['error'] = f"{type(error).__name__}: {error}"
+            records.append(record)
+    return records
+
+
+def fit_exponent(sizes: list, seconds: list) -> float:
+    """Least squares slope of log(seconds) against log(size)
+
+    Args:
+        sizes (list): input sizes
+        seconds (list): measured times
+
+    Returns:
+        float: exponent k of seconds ~ size^k, None if it can not be fitted
+    """
+    points = [(math.log(size), math.log(sec)) for size, sec in zip(sizes, seconds) if sec > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def scaling_records(timings: list) -> list:
+    """Fits complexity exponent for every day and phase
+
+    Args:
+        timings (list): timing records of a single day
+
+    Returns:
+        list: scaling records
+    """
+    valid = [record for record in timings if record['kind'] == 'timing' and 'error' not in record]
+    if not valid:
+        return []
+    records = []
+    for phase in ('load', 'parse') + tuple(f"part{part}" for part in PARTS):
+        exponent = fit_exponent([record['size'] for record in valid],
+                                [record[phase] for record in valid])
+        records.append({'kind': 'scaling', 'day': valid[0]['day'], 'phase': phase,
+                        'exponent': None if exponent is None else round(exponent, 3)})
+    return records
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """Parses command line arguments"""
+    parser = argparse.ArgumentParser(description="Benchmark Advent of Code 2022 solvers")
+    parser.add_argument('--days', type=int, nargs='+', help="days to benchmark, defaults to all")
+    parser.add_argument('--repeat', type=int, default=1, help="measurements per phase")
+    parser.add_argument('--seed', type=int, default=0, help="generators seed")
+    parser.add_argument('--output', default=OUTPUT_FILE, help="JSON lines output file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    """Runs benchmark and writes results
+
+    Returns:
+        int: exit code
+    """
+    args = parse_args(argv)
+    days = args.days or [day for day in discover_days() if day in SIZES]
+    with open(args.output, mode='w', encoding="UTF-8") as output:
+        for day in days:
+            timings = bench_day(day, SIZES[day], args.repeat, args.seed)
+            for record in timings + scaling_records(timings):
+                output.write(json.dumps(record) + '\n')
+                print(json.dumps(record))
+            output.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
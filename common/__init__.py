@@ -0,0 +1 @@
+"""Advent of Code 2022 - shared helpers used by all days"""
@@ -0,0 +1,140 @@
+"""Advent of Code 2022 - content-addressed on-disk cache
+
+Parsed inputs and answers are stored under a key derived from hash of input
+bytes and hash of solver source together with shared input layer it is
+parsed with, so editing either one makes old entries
+unreachable. Entries are zlib-compressed pickles, least recently used ones
+are evicted once the cache grows over its size cap.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from pathlib import Path
+from types import ModuleType
+
+from common.inputs import read_chunks
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.aoc_cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ENTRY_SUFFIX = '.bin'
+FORMAT_VERSION = 1  # bump when layout of cached entries changes
+# shared modules on the load and parse path, their edits invalidate parsed entries as well
+SHARED_SOURCES = tuple(Path(__file__).resolve().parent / name for name in ('inputs.py', 'days.py'))
+MISSING = object()
+
+
+def input_digest(file_path: str) -> str:
+    """Hashes input file contents
+
+    Args:
+        file_path (str): file name
+
+    Returns:
+        str: hex digest of file bytes
+    """
+    digest = hashlib.sha256()
+    for chunk in read_chunks(file_path):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def solver_version(module: ModuleType) -> str:
+    """Identifies solver version by hash of its source file, SHARED_SOURCES
+    and FORMAT_VERSION
+
+    Args:
+        module (ModuleType): day solver module
+
+    Returns:
+        str: hex digest of solver and shared sources
+    """
+    digest = hashlib.sha256(str(FORMAT_VERSION).encode())
+    for path in (Path(module.__file__), *SHARED_SOURCES):
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def make_key(*parts) -> str:
+    """Builds cache key from its parts, e.g. kind, day, input digest, solver version
+
+    Returns:
+        str: hex key
+    """
+    return hashlib.sha256('\0'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+class DiskCache():
+    """Directory of compressed pickles with LRU eviction based on file modification time
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory (str, optional): cache directory. Defaults to CACHE_DIR.
+            max_bytes (int, optional): size cap of all entries. Defaults to DEFAULT_MAX_BYTES.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (key + ENTRY_SUFFIX)
+
+    def get(self, key: str) -> object:
+        """Reads entry and marks it as recently used
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            object: stored value or MISSING
+        """
+        path = self._path(key)
+        try:
+            payload = path.read_bytes()
+            os.utime(path)
+            return pickle.loads(zlib.decompress(payload))
+        except FileNotFoundError:  # also when evicted by another process meanwhile
+            return MISSING
+        except (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            path.unlink(missing_ok=True)  # corrupted or stale entry
+            return MISSING
+
+    def put(self, key: str, value: object):
+        """Stores entry atomically, then evicts least recently used entries over size cap
+
+        Args:
+            key (str): cache key
+            value (object): picklable value
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_path, self._path(key))
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until cache fits its size cap
+        """
+        entries = []
+        for path in self.directory.glob('*' + ENTRY_SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """Removes all entries
+        """
+        for path in self.directory.glob('*' + ENTRY_SUFFIX):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,171 @@
+"""Advent of Code 2022 - discovery and execution of day solvers
+
+Every DayN/<module>.py exposes the same interface:
+    INPUT_FILE - default input path, relative to repository root
+    parse(lines) - turns input lines into the day's data structure
+    part1(data), part2(data) - answers for parsed data, data is not modified
+"""
+import importlib.util
+import re
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import NamedTuple
+
+from common.cache import DEFAULT_MAX_BYTES, MISSING, DiskCache, input_digest, make_key, solver_version
+from common.inputs import load_input
+from common.instrument import Instrument
+from common.memory import MemoryProfiler
+
+ROOT = Path(__file__).resolve().parent.parent
+PARTS = (1, 2)
+_NO_INSTRUMENT = Instrument()
+
+
+class TaskResult(NamedTuple):
+    """Outcome of solving one part of one day"""
+    day: int
+    part: int
+    answer: object
+    seconds: float
+    error: str = None
+    phases: list = None  # Instrument.records() when instrumentation is enabled
+    memory: list = None  # MemoryProfiler.records() when memory profiling is enabled
+
+
+def discover_days() -> dict:
+    """Finds all day solvers in repository
+
+    Returns:
+        dict: day number with path to its solver module, sorted by day
+    """
+    days = {}
+    for path in ROOT.glob('Day*/*.py'):
+        match = re.fullmatch(r"Day(\d+)", path.parent.name)
+        if match:
+            days[int(match.group(1))] = path
+    return dict(sorted(days.items()))
+
+
+def load_day(day: int) -> ModuleType:
+    """Imports solver module of given day, module is imported only once per process
+
+    Args:
+        day (int): day number
+
+    Returns:
+        ModuleType: solver module
+    """
+    name = f"day{day}"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, discover_days()[day])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name]
+
+
+def input_path(day: int) -> Path:
+    """Finds default input file of given day
+
+    Args:
+        day (int): day number
+
+    Returns:
+        Path: absolute path to input file
+    """
+    return ROOT / load_day(day).INPUT_FILE
+
+
+def solve(day: int, part: int, file_path: str = None,
+          instrument: Instrument = None, cache: DiskCache = None) -> object:
+    """Loads, parses and solves one part of given day
+
+    Args:
+        day (int): day number
+        part (int): part number, 1 or 2
+        file_path (str, optional): input file. Defaults to day's INPUT_FILE.
+        instrument (Instrument, optional): records load, parse and part phases,
+            MemoryProfiler can be used as well. Defaults to None.
+        cache (DiskCache, optional): reuses parsed input and answer of previous runs
+            on the same input and solver source. Defaults to None.
+
+    Returns:
+        object: answer
+    """
+    instrument = instrument or _NO_INSTRUMENT
+    module = load_day(day)
+    file_path = file_path or input_path(day)
+    solver = getattr(module, f"part{part}")
+    if cache is None:
+        data = _parse(module, day, file_path, instrument)
+        with instrument.phase(day, f"part{part}"):
+            return solver(data)
+
+    with instrument.phase(day, 'hash'):
+        version = make_key(input_digest(file_path), solver_version(module))
+    answer_key = make_key('answer', day, part, version)
+    answer = cache.get(answer_key)
+    if answer is not MISSING:
+        return answer
+    parsed_key = make_key('parsed', day, version)
+    data = cache.get(parsed_key)
+    if data is MISSING:
+        data = _parse(module, day, file_path, instrument)
+        cache.put(parsed_key, data)
+    with instrument.phase(day, f"part{part}"):
+        answer = solver(data)
+    cache.put(answer_key, answer)
+    return answer
+
+
+def _parse(module: ModuleType, day: int, file_path: str, instrument: Instrument) -> object:
+    """Runs load and parse phases of given day"""
+    with instrument.phase(day, 'load'):
+        lines = load_input(file_path)
+    with instrument.phase(day, 'parse'):
+        return module.parse(lines)
+
+
+def run_task(day: int, part: int, file_path: str = None, instrument: bool = False,
+             count_calls: bool = False, cache_dir: str = None,
+             cache_max_bytes: int = DEFAULT_MAX_BYTES, profile_memory: bool = False,
+             memory_top: int = 5) -> TaskResult:
+    """Solves one part of given day measuring wall time, errors are reported instead of raised
+    so that a single broken day does not stop the others
+
+    Args:
+        day (int): day number
+        part (int): part number, 1 or 2
+        file_path (str, optional): input file. Defaults to day's INPUT_FILE.
+        instrument (bool, optional): record per phase statistics. Defaults to False.
+        count_calls (bool, optional): count function calls in phases. Defaults to False.
+        cache_dir (str, optional): use on-disk cache in given directory. Defaults to None (no cache).
+        cache_max_bytes (int, optional): cache size cap. Defaults to DEFAULT_MAX_BYTES.
+        profile_memory (bool, optional): record peak memory and top allocation sites per phase,
+            replaces instrument as tracing distorts timings anyway. Defaults to False.
+        memory_top (int, optional): allocation sites reported per phase. Defaults to 5.
+
+    Returns:
+        TaskResult: answer with wall time
+    """
+    phases = Instrument(instrument, count_calls)
+    memory = MemoryProfiler(memory_top) if profile_memory else None
+    cache = DiskCache(cache_dir, cache_max_bytes) if cache_dir else None
+    answer, error = None, None
+    start = time.perf_counter()
+    try:
+        if memory:
+            with memory:
+                answer = solve(day, part, file_path, memory, cache)
+        else:
+            answer = solve(day, part, file_path, phases, cache)
+    except Exception as exception:  # reported back to the runner
+        error = f"{type(exception).__name__}: {exception}"
+    return TaskResult(day, part, answer, time.perf_counter() - start, error,
+                      phases.records() or None, memory.records() if memory else None)
@@ -0,0 +1,310 @@
+"""Advent of Code 2022 - seeded synthetic input generators
+
+Every generator takes a size (meaning depends on the day, see GENERATORS)
+and a seed, and returns text of a valid puzzle input for that day.
+Same size and seed always give the same input.
+"""
+import random
+import string
+
+LETTERS = string.ascii_lowercase + string.ascii_uppercase  # in priority order
+
+
+def generate_day1(elves: int, seed: int = 0) -> str:
+    """Calorie lists, groups of items separated by blank lines
+
+    Args:
+        elves (int): number of elves counted by the solver
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    groups = ('\n'.join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 6)))
+              for _ in range(elves + 1))
+    # solver counts only groups closed by a blank line, so the last group is not counted
+    return '\n\n'.join(groups) + '\n'
+
+
+def generate_day2(rounds: int, seed: int = 0) -> str:
+    """Rock-paper-scissors strategy guide
+
+    Args:
+        rounds (int): number of rounds
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    return ''.join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(rounds))
+
+
+def _rucksack(pool: list, badge: str, length: int, rng: random.Random) -> str:
+    """Builds rucksack from given pool of letters plus badge, both compartments
+    have exactly one item in common and badge is somewhere inside
+    """
+    letters = pool + [badge]
+    shared = rng.choice(letters)
+    rest = [letter for letter in letters if letter != shared]
+    rng.shuffle(rest)
+    only_first, only_second = rest[: len(rest)//2], rest[len(rest)//2:]
+    first = [shared] + rng.choices(only_first, k=length-1)
+    second = [shared] + rng.choices(only_second, k=length-1)
+    if badge != shared:
+        side = first if badge in only_first else second
+        side[-1] = badge
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return ''.join(first) + ''.join(second)
+
+
+def generate_day3(rucksacks: int, seed: int = 0) -> str:
+    """Rucksack contents, groups of three share exactly one badge
+
+    Args:
+        rucksacks (int): number of rucksacks, rounded down to multiple of 3
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(rucksacks // 3):
+        badge = rng.choice(LETTERS)
+        pool = [letter for letter in LETTERS if letter != badge]
+        rng.shuffle(pool)
+        for idx in range(3):  # disjoint pools, so badge is the only common item
+            lines.append(_rucksack(pool[idx*17: (idx+1)*17], badge, rng.randint(4, 16), rng))
+    return ''.join(line + '\n' for line in lines)
+
+
+def generate_day4(pairs: int, seed: int = 0, max_section: int = 99) -> str:
+    """Pairs of section assignments
+
+    Args:
+        pairs (int): number of pairs
+        seed (int, optional): random seed. Defaults to 0.
+        max_section (int, optional): highest section id. Defaults to 99.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+
+    def assignment() -> str:
+        lower = rng.randint(1, max_section)
+        return f"{lower}-{rng.randint(lower, max_section)}"
+
+    return ''.join(f"{assignment()},{assignment()}\n" for _ in range(pairs))
+
+
+def generate_day5(moves: int, seed: int = 0, stacks: int = 9) -> str:
+    """Stacks of crates drawing followed by crane moves, no stack is ever emptied
+
+    Args:
+        moves (int): number of moves
+        seed (int, optional): random seed. Defaults to 0.
+        stacks (int, optional): number of stacks, at most 9. Defaults to 9.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    crates = [[rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, 8))]
+              for _ in range(stacks)]
+    heights = [len(stack) for stack in crates]
+
+    lines = []
+    for level in range(max(heights)-1, -1, -1):
+        row = ' '.join(f"[{stack[level]}]" if level < len(stack) else '   ' for stack in crates)
+        lines.append(row)
+    lines.append(' '.join(f" {idx+1} " for idx in range(stacks)))
+    lines.append('')
+    for _ in range(moves):
+        source = rng.choice([idx for idx, height in enumerate(heights) if height > 1])
+        target = rng.choice([idx for idx in range(stacks) if idx != source])
+        count = rng.randint(1, heights[source]-1)
+        heights[source] -= count
+        heights[target] += count
+        lines.append(f"move {count} from {source+1} to {target+1}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day6(length: int, seed: int = 0) -> str:
+    """Datastream with both markers placed at its very end
+
+    Args:
+        length (int): number of characters, at least 14
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    # three letter filler never has 4 distinct characters in a row
+    filler = ''.join(rng.choice('abc') for _ in range(max(length-14, 0)))
+    return filler + ''.join(rng.sample(string.ascii_lowercase[3:], 14)) + '\n'
+
+
+def generate_day7(files: int, seed: int = 0) -> str:
+    """Terminal transcript of walking over random directory tree
+
+    Args:
+        files (int): number of files, tree gets about a fifth as many directories
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    children = [[]]
+    for dir_id in range(1, max(files // 5, 1)):
+        children[rng.randrange(dir_id)].append(dir_id)
+        children.append([])
+    dir_files = [[] for _ in children]
+    for file_id in range(files):
+        dir_files[rng.randrange(len(children))].append((f"f{file_id}.txt", rng.randint(1, 100000)))
+
+    lines = ['$ cd /']
+    stack = [(0, 'list')]
+    while stack:
+        dir_id, action = stack.pop()
+        if action == 'leave':
+            lines.append('$ cd ..')
+            continue
+        if action == 'enter':
+            lines.append(f"$ cd d{dir_id}")
+        lines.append('$ ls')
+        lines.extend(f"dir d{child}" for child in children[dir_id])
+        lines.extend(f"{size} {name}" for name, size in dir_files[dir_id])
+        for child in reversed(children[dir_id]):
+            stack.append((child, 'leave'))
+            stack.append((child, 'enter'))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day8(side: int, seed: int = 0) -> str:
+    """Square grid of tree heights
+
+    Args:
+        side (int): grid side
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    return ''.join(''.join(rng.choice(string.digits) for _ in range(side)) + '\n'
+                   for _ in range(side))
+
+
+def generate_day9(moves: int, seed: int = 0) -> str:
+    """Rope head moves
+
+    Args:
+        moves (int): number of moves
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    return ''.join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n" for _ in range(moves))
+
+
+def generate_day10(commands: int, seed: int = 0) -> str:
+    """CPU program of noop and addx commands
+
+    Args:
+        commands (int): number of commands
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    return ''.join('noop\n' if rng.random() < 0.3 else f"addx {rng.randint(-5, 5)}\n"
+                   for _ in range(commands))
+
+
+def generate_day11(monkeys: int, seed: int = 0) -> str:
+    """Monkeys notes with distinct prime divisors
+
+    Args:
+        monkeys (int): number of monkeys, at most 15
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    rng = random.Random(seed)
+    primes = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47], monkeys)
+    notes = []
+    for number, prime in enumerate(primes):
+        others = [idx for idx in range(monkeys) if idx != number]
+        operation = rng.choice(
+            ['old * old', f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        notes.append(f"Monkey {number}:\n"
+                     f"  Starting items: {items}\n"
+                     f"  Operation: new = {operation}\n"
+                     f"  Test: divisible by {prime}\n"
+                     f"    If true: throw to monkey {rng.choice(others)}\n"
+                     f"    If false: throw to monkey {rng.choice(others)}\n")
+    return '\n'.join(notes)
+
+
+def generate_day12(side: int, seed: int = 0) -> str:
+    """Square hills map rising from 'S' in top-left to 'E' in bottom-right corner,
+    random walls are placed off a carved path so 'E' is always reachable
+
+    Args:
+        side (int): grid side, at least 14
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: puzzle input
+    """
+    if side < 14:
+        raise ValueError("side has to be at least 14 to climb from 'a' to 'z' one step at a time")
+    rng = random.Random(seed)
+    path = {(0, 0)}
+    x, y = 0, 0
+    while (x, y) != (side-1, side-1):
+        if y == side-1 or (x < side-1 and rng.random() < 0.5):
+            x += 1
+        else:
+            y += 1
+        path.add((x, y))
+
+    rows = []
+    for x in range(side):
+        row = []
+        for y in range(side):
+            height = min(25, (x + y) * 25 // (2 * (side - 1)))
+            if (x, y) not in path and rng.random() < 0.25:
+                height = min(25, height + rng.randint(2, 5))
+            row.append(string.ascii_lowercase[height])
+        rows.append(row)
+    rows[0][0] = 'S'
+    rows[side-1][side-1] = 'E'
+    return ''.join(''.join(row) + '\n' for row in rows)
+
+
+GENERATORS = {
+    1: generate_day1,    # elves
+    2: generate_day2,    # rounds
+    3: generate_day3,    # rucksacks
+    4: generate_day4,    # pairs
+    5: generate_day5,    # moves
+    6: generate_day6,    # stream length
+    7: generate_day7,    # files
+    8: generate_day8,    # grid side
+    9: generate_day9,    # moves
+    10: generate_day10,  # commands
+    11: generate_day11,  # monkeys
+    12: generate_day12,  # grid side
+}
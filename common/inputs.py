@@ -0,0 +1,104 @@
+"""Advent of Code 2022 - shared input layer
+
+All days read their puzzle input through this module. Besides the eager
+load_input() kept for solvers that need random access to lines, it offers
+lazy readers that keep memory flat no matter how big the input file is.
+"""
+import mmap
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def load_input(file_path: str) -> list:
+    """Loads input data from txt file
+
+    Args:
+        file_path (str): file name
+
+    Returns:
+        list: list of file contents line by line
+    """
+    return list(read_lines(file_path))
+
+
+def read_lines(file_path: str) -> Iterator[str]:
+    """Lazily yields lines of input file without line endings.
+    Trailing blank lines are dropped, so the result matches
+    file.read().rstrip().split('\\n') while holding a single line at a time.
+
+    Args:
+        file_path (str): file name
+
+    Yields:
+        str: next line of file
+    """
+    with open(file_path, mode='r', encoding="UTF-8") as file:
+        pending_blank = []  # blank lines are emitted only once a non-blank line follows them
+        previous = None
+        for line in file:
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                pending_blank.append(line)
+                continue
+            if previous is not None:
+                yield previous
+            yield from pending_blank
+            pending_blank.clear()
+            previous = line
+        if previous is not None:
+            yield previous.rstrip()
+
+
+@contextmanager
+def map_input(file_path: str) -> Iterator[bytes]:
+    """Memory-maps input file read-only, pages are loaded by the OS on demand
+
+    Args:
+        file_path (str): file name
+
+    Yields:
+        bytes: bytes-like view of the whole file (mmap object, or b'' for empty file)
+    """
+    with open(file_path, mode='rb') as file:
+        try:
+            view = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can not be mapped
+            yield b''
+            return
+        try:
+            yield view
+        finally:
+            view.close()
+
+
+def read_chunks(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Lazily yields input file in fixed size binary chunks
+
+    Args:
+        file_path (str): file name
+        chunk_size (int, optional): bytes per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Yields:
+        bytes: next chunk of file, last one may be shorter
+    """
+    with open(file_path, mode='rb') as file:
+        yield from read_stream(file, chunk_size)
+
+
+def read_stream(stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Lazily yields chunks of already opened binary stream, e.g. sys.stdin.buffer or socket file.
+    When stream supports read1() chunks are handed out as soon as any data arrives,
+    without waiting for full chunk_size
+
+    Args:
+        stream (BinaryIO): binary file-like object
+        chunk_size (int, optional): maximum bytes per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Yields:
+        bytes: next chunk of stream
+    """
+    read = getattr(stream, 'read1', stream.read)
+    while chunk := read(chunk_size):
+        yield chunk
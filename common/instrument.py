@@ -0,0 +1,125 @@
+"""Advent of Code 2022 - opt-in per-phase instrumentation
+
+Phases (load, parse, part1, part2 and hash when cache is used) of every day are wrapped with
+Instrument.phase(). When instrument is disabled phase() hands out one shared
+no-op context manager, so the only cost is a single attribute check.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+PHASES = ('hash', 'load', 'parse', 'part1', 'part2')
+_DISABLED = nullcontext()
+
+
+class Instrument():
+    """Collects wall time, number of runs and allocation deltas per day and phase
+    """
+
+    def __init__(self, enabled: bool = False, count_calls: bool = False):
+        """
+        Args:
+            enabled (bool, optional): record phases. Defaults to False.
+            count_calls (bool, optional): also count Python function calls inside phases,
+                slows phases down noticeably. Defaults to False.
+        """
+        self.enabled = enabled
+        self.count_calls = count_calls
+        self.stats = {}  # (day, phase) -> dict of totals
+
+    def phase(self, day: int, name: str):
+        """Context manager measuring a single run of a phase
+
+        Args:
+            day (int): day number
+            name (str): phase name
+
+        Returns:
+            context manager
+        """
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(day, name)
+
+    @contextmanager
+    def _measure(self, day: int, name: str):
+        calls = [0]
+        previous_profile = sys.getprofile()
+        if self.count_calls:
+            def profile(_frame, event, _arg):
+                if event in ('call', 'c_call'):
+                    calls[0] += 1
+            sys.setprofile(profile)
+        traced_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        blocks_before = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            blocks = sys.getallocatedblocks() - blocks_before
+            if self.count_calls:
+                sys.setprofile(previous_profile)
+            record = {'runs': 1, 'seconds': seconds, 'alloc_blocks': blocks}
+            if traced_before is not None:
+                record['alloc_bytes'] = tracemalloc.get_traced_memory()[0] - traced_before
+            if self.count_calls:
+                record['function_calls'] = calls[0]
+            self.add(day, name, record)
+
+    def add(self, day: int, name: str, record: dict):
+        """Adds measurement to totals of given day and phase, used also to merge
+        records coming from worker processes
+
+        Args:
+            day (int): day number
+            name (str): phase name
+            record (dict): measured values
+        """
+        totals = self.stats.setdefault((day, name), {})
+        for key, value in record.items():
+            totals[key] = totals.get(key, 0) + value
+
+    def records(self) -> list:
+        """Collected totals as flat list of dicts, sorted by day and phase order
+
+        Returns:
+            list: records with day and phase keys
+        """
+        order = {name: idx for idx, name in enumerate(PHASES)}
+        keys = sorted(self.stats, key=lambda key: (key[0], order.get(key[1], len(order)), key[1]))
+        return [{'day': day, 'phase': name, **self.stats[(day, name)]} for day, name in keys]
+
+    def to_json(self) -> str:
+        """Collected totals as JSON
+
+        Returns:
+            str: JSON list of records
+        """
+        return json.dumps(self.records(), indent=2)
+
+    def summary(self) -> str:
+        """Collected totals as printable table
+
+        Returns:
+            str: table with one row per day and phase
+        """
+        columns = ['day', 'phase', 'runs', 'seconds', 'alloc_blocks', 'alloc_bytes', 'function_calls']
+        records = self.records()
+        if not records:
+            return "no phases recorded"
+        columns = [column for column in columns if any(column in record for record in records)]
+        rows = [[_format(record.get(column, '')) for column in columns] for record in records]
+        widths = [max(len(column), *(len(row[idx]) for row in rows)) for idx, column in enumerate(columns)]
+        lines = ['  '.join(column.rjust(width) for column, width in zip(columns, widths))]
+        lines.extend('  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+        return '\n'.join(lines)
+
+
+def _format(value) -> str:
+    """Formats table cell"""
+    if isinstance(value, float):
+        return f"{value:.6f}"
+    return str(value)
@@ -0,0 +1,186 @@
+"""Advent of Code 2022 - peak memory and allocation profiling
+
+MemoryProfiler offers the same phase(day, name) interface as Instrument, so
+it can be handed to common.days.solve(). For every phase it reports peak of
+memory traced by tracemalloc, memory still held when phase ends, peak RSS
+sampled by background thread and source lines holding the most of memory
+allocated during the phase.
+"""
+import fnmatch
+import os
+import re
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STATM_FILE = '/proc/self/statm'
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+# allocations of the profiler itself, dropped from reported sites
+_IGNORED = (
+    tracemalloc.__file__,
+    threading.__file__,
+    '*/_weakrefset.py',
+    __file__,
+    '<frozen importlib._bootstrap>',
+    '<unknown>',
+)
+_IGNORED_RE = re.compile('|'.join(fnmatch.translate(pattern) for pattern in _IGNORED))
+
+
+def current_rss() -> int:
+    """Resident set size of current process
+
+    Returns:
+        int: bytes, peak RSS of process lifetime when /proc is not available,
+            0 where neither /proc nor resource module (Unix only) is available
+    """
+    try:
+        with open(STATM_FILE, mode='r', encoding="UTF-8") as file:
+            return int(file.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # KiB on Linux
+
+
+class RssSampler():
+    """Samples RSS in background thread, keeps the highest value seen
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval (float, optional): seconds between samples. Defaults to 0.005.
+        """
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while True:
+            self.peak = max(self.peak, current_rss())
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self):
+        """Starts sampling"""
+        self.peak = current_rss()
+        self._thread.start()
+
+    def stop(self) -> int:
+        """Stops sampling
+
+        Returns:
+            int: peak RSS in bytes
+        """
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+        return self.peak
+
+
+class MemoryProfiler():
+    """Collects memory statistics per day and phase, use as context manager
+    so that tracemalloc is started and stopped around profiled code
+    """
+
+    def __init__(self, top: int = 5, frames: int = 1, interval: float = 0.005):
+        """
+        Args:
+            top (int, optional): number of reported allocation sites per phase. Defaults to 5.
+            frames (int, optional): traceback depth stored by tracemalloc. Defaults to 1.
+            interval (float, optional): seconds between RSS samples. Defaults to 0.005.
+        """
+        self.top = top
+        self.frames = frames
+        self.interval = interval
+        self.stats = {}  # (day, phase) -> record
+        self._started = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @contextmanager
+    def phase(self, day: int, name: str):
+        """Context manager profiling a single run of a phase
+
+        Args:
+            day (int): day number
+            name (str): phase name
+        """
+        before = tracemalloc.take_snapshot()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        sampler = RssSampler(self.interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            peak_rss = sampler.stop()
+            after = tracemalloc.take_snapshot()
+            self.stats[(day, name)] = {
+                'peak_traced_bytes': traced_peak - traced_before,
+                'retained_bytes': traced - traced_before,
+                'peak_rss_bytes': peak_rss,
+                'top_sites': self._top_sites(after.compare_to(before, 'lineno')),
+            }
+
+    def _top_sites(self, differences: list) -> list:
+        """Source lines whose allocations grew the most during phase, differences are
+        filtered rather than snapshots as there are far fewer of them than traces"""
+        grown = sorted((difference for difference in differences if difference.size_diff > 0
+                        and not _is_ignored(difference.traceback[0].filename)),
+                       key=lambda difference: difference.size_diff, reverse=True)
+        sites = []
+        for difference in grown[: self.top]:
+            frame = difference.traceback[0]
+            file_name = Path(frame.filename)
+            if file_name.is_relative_to(ROOT):
+                file_name = file_name.relative_to(ROOT)
+            sites.append({'site': f"{file_name}:{frame.lineno}",
+                          'size_diff': difference.size_diff, 'count_diff': difference.count_diff})
+        return sites
+
+    def records(self) -> list:
+        """Collected statistics as flat list of dicts in order of phases
+
+        Returns:
+            list: records with day and phase keys
+        """
+        return [{'day': day, 'phase': name, **record} for (day, name), record in self.stats.items()]
+
+
+def _is_ignored(file_name: str) -> bool:
+    """Checks if allocation site belongs to ignored files"""
+    return _IGNORED_RE.match(file_name) is not None
+
+
+def format_bytes(size: int) -> str:
+    """Formats size in bytes with binary unit
+
+    Args:
+        size (int): bytes
+
+    Returns:
+        str: human readable size
+    """
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if abs(size) < 1024 or unit == 'GiB':
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return str(size)
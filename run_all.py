@@ -0,0 +1,156 @@
+"""Advent of Code 2022 - runs every day solver in parallel
+
+Usage:
+    python run_all.py [--days 1 5 11] [--workers N] [--instrument [--json] [--count-calls]]
+                      [--cache [--cache-dir DIR] [--cache-size-mb MB] [--clear-cache]]
+                      [--profile-memory [--top N]]
+
+Both parts of every day are separate tasks in a process pool, so full run
+takes about as long as the slowest part instead of the sum of all of them.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from common.cache import CACHE_DIR, DEFAULT_MAX_BYTES, DiskCache
+from common.days import PARTS, TaskResult, discover_days, run_task
+from common.instrument import Instrument
+from common.memory import format_bytes
+
+
+def format_result(result: TaskResult) -> str:
+    """Formats single task result as a line of report
+
+    Args:
+        result (TaskResult): task result
+
+    Returns:
+        str: report line, multiline answers are placed below it
+    """
+    header = f"Day {result.day:>2} part {result.part}  {result.seconds:9.3f}s  "
+    if result.error:
+        return header + f"ERROR {result.error}"
+    answer = str(result.answer)
+    if '\n' in answer:
+        return header.rstrip() + '\n' + answer.rstrip('\n')
+    return header + answer
+
+
+def format_memory(result: TaskResult) -> str:
+    """Formats memory profile of single task
+
+    Args:
+        result (TaskResult): task result with memory records
+
+    Returns:
+        str: one line per phase followed by its top allocation sites
+    """
+    lines = []
+    for record in result.memory or []:
+        lines.append(f"    {record['phase']:<6} peak traced {format_bytes(record['peak_traced_bytes']):>10}"
+                     f"  retained {format_bytes(record['retained_bytes']):>10}"
+                     f"  peak RSS {format_bytes(record['peak_rss_bytes']):>10}")
+        lines.extend(f"        {format_bytes(site['size_diff']):>10} in {site['count_diff']:>8} blocks"
+                     f"  {site['site']}" for site in record['top_sites'])
+    return '\n'.join(lines)
+
+
+def run_all(days: list, workers: int = None, **task_options) -> list:
+    """Runs both parts of given days in a process pool
+
+    Args:
+        days (list): day numbers to run
+        workers (int, optional): number of worker processes. Defaults to number of cores.
+        task_options: passed to run_task, e.g. instrument=True
+
+    Returns:
+        list: task results sorted by day and part
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_task, day, part, **task_options) for day in days for part in PARTS]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda result: (result.day, result.part))
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """Parses command line arguments
+
+    Args:
+        argv (list, optional): arguments. Defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2022 solvers in parallel")
+    parser.add_argument('--days', type=int, nargs='+', help="days to run, defaults to all")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--instrument', action='store_true',
+                        help="record time and allocations of load, parse and part phases")
+    parser.add_argument('--count-calls', action='store_true',
+                        help="with --instrument, also count function calls (slow)")
+    parser.add_argument('--json', action='store_true', help="print whole report as JSON")
+    parser.add_argument('--cache', action='store_true',
+                        help="reuse parsed inputs and answers stored by previous runs")
+    parser.add_argument('--cache-dir', default=str(CACHE_DIR), help="cache directory")
+    parser.add_argument('--cache-size-mb', type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help="cache size cap, least recently used entries are evicted above it")
+    parser.add_argument('--clear-cache', action='store_true', help="empty cache before running")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="report peak memory and top allocation sites of every phase")
+    parser.add_argument('--top', type=int, default=5, help="allocation sites reported per phase")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    """Runs selected days and prints report
+
+    Args:
+        argv (list, optional): arguments. Defaults to sys.argv.
+
+    Returns:
+        int: exit code, 1 if any task failed
+    """
+    args = parse_args(argv)
+    days = args.days or list(discover_days())
+    if args.clear_cache:
+        DiskCache(args.cache_dir).clear()
+    start = time.perf_counter()
+    results = run_all(days, args.workers, instrument=args.instrument, count_calls=args.count_calls,
+                      cache_dir=args.cache_dir if args.cache else None,
+                      cache_max_bytes=int(args.cache_size_mb * 2**20),
+                      profile_memory=args.profile_memory, memory_top=args.top)
+    wall_time = time.perf_counter() - start
+
+    phases = Instrument(enabled=True)
+    for result in results:
+        for record in result.phases or []:
+            record = dict(record)
+            phases.add(record.pop('day'), record.pop('phase'), record)
+
+    if args.json:
+        print(json.dumps({
+            'tasks': [{'day': result.day, 'part': result.part, 'seconds': result.seconds, 'error': result.error,
+                       'answer': None if result.answer is None else str(result.answer),
+                       'memory': result.memory}
+                      for result in results],
+            'phases': phases.records(),
+            'wall_time': wall_time,
+        }, indent=2))
+    else:
+        for result in results:
+            print(format_result(result))
+            if result.memory:
+                print(format_memory(result))
+        if args.instrument:
+            print(phases.summary())
+        print(f"Total wall time: {wall_time:.3f}s")
+    return int(any(result.error for result in results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())